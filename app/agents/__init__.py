@@ -7,13 +7,23 @@ Agents corresponding to each phase of the SECI model:
 - Combiner: Combination (Systemising Ba)
 - Internalizer: Internalization (Exercising Ba)
 - Challenger: Meta-level validation across all phases
+
+Agents take their Anthropic clients as constructor arguments. Pass every
+agent the same client instances (see SECIOrchestrator and agents.clients):
+constructing a separate Anthropic() per agent gives each its own connection
+pool and defeats connection reuse.
 """
 
-from .socializer import Socializer
-from .externalizer import Externalizer
-from .combiner import Combiner
-from .internalizer import Internalizer
-from .orchestrator import SECIOrchestrator
+import importlib
+
+# 이름 → 모듈 매핑: 처음 접근할 때만 해당 Agent 모듈을 import (PEP 562)
+_LAZY_IMPORTS = {
+    "Socializer": ".socializer",
+    "Externalizer": ".externalizer",
+    "Combiner": ".combiner",
+    "Internalizer": ".internalizer",
+    "SECIOrchestrator": ".orchestrator",
+}
 
 __all__ = [
     "Socializer",
@@ -22,3 +32,18 @@ __all__ = [
     "Internalizer",
     "SECIOrchestrator"
 ]
+
+
+def __getattr__(name):
+    """Agent 클래스를 처음 사용할 때 import"""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """지연 로딩 대상도 자동완성에 노출"""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
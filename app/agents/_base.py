@@ -0,0 +1,343 @@
+"""
+Base Agent
+
+Plumbing shared by the SECI agents: client wiring, phase completion,
+structured output via forced tool use, JSON extraction and repair, the
+response cache and prompt-cache breakpoints.
+"""
+
+import asyncio
+from contextlib import nullcontext
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+from pydantic import BaseModel, ValidationError
+from anthropic import Anthropic, AsyncAnthropic, APIError
+
+from agents import _llm_cache
+from agents._json_extract import aread_json_object, extract_json, read_json_object
+from prompts.seci_prompts import JSON_REPAIR_PROMPT
+from utils.helpers import schema_for
+
+# 정적 프롬프트는 Anthropic 프롬프트 캐시로 재사용
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# 파싱 실패 시 JSON 복구에 사용할 저렴한 모델
+REPAIR_MODEL = "claude-3-5-haiku-20241022"
+
+# API에 그대로 보내는 최근 턴 수 (그 이전 대화는 요약으로 대체)
+MAX_TURNS_VERBATIM = 6
+SUMMARY_MODEL = "claude-3-5-haiku-20241022"
+
+
+def response_output(message) -> str:
+    """
+    API 응답에서 결과 JSON 텍스트 추출
+
+    도구 호출(tool_use)이 있으면 그 입력을 JSON 문자열로, 없으면 텍스트 블록을 반환합니다.
+    """
+    for block in message.content:
+        if block.type == "tool_use":
+            return orjson.dumps(block.input).decode()
+    return "".join(block.text for block in message.content if block.type == "text")
+
+
+def _output_chunks(events: Iterable) -> Iterator[str]:
+    """스트림 이벤트에서 도구 입력 JSON 또는 텍스트 조각만 추림"""
+    for event in events:
+        if event.type == "content_block_delta":
+            if event.delta.type == "input_json_delta":
+                yield event.delta.partial_json
+            elif event.delta.type == "text_delta":
+                yield event.delta.text
+
+
+async def _aoutput_chunks(events: AsyncIterable) -> AsyncIterator[str]:
+    """스트림 이벤트에서 도구 입력 JSON 또는 텍스트 조각만 추림 (비동기)"""
+    async for event in events:
+        if event.type == "content_block_delta":
+            if event.delta.type == "input_json_delta":
+                yield event.delta.partial_json
+            elif event.delta.type == "text_delta":
+                yield event.delta.text
+
+
+class BaseAgent:
+    """SECI Agent 공통 기반 클래스"""
+
+    # Message Batches API로 처리 가능한지 여부 (batch_processor 참고)
+    batch_eligible = False
+
+    # 생성 결과 모델과 이를 받는 도구 - 서브클래스에서 지정
+    output_model: Optional[type] = None
+    output_tool_name: Optional[str] = None
+    output_tool_description = ""
+
+    # 결과 도구 호출을 강제하는 요청 파라미터 (클래스 정의 시 생성)
+    tool_params: dict = {}
+
+    # 대화 압축 설정 - 대화형 서브클래스에서 지정 (_windowed_history 참고)
+    pinned_messages = 0
+    speaker_label = "AI"
+    summary_prompt = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 모델의 JSON Schema를 도구 입력 스키마로 사용 (schema_for가 모델별로 한 번만 생성)
+        if cls.output_model is not None and cls.output_tool_name:
+            tool = {
+                "name": cls.output_tool_name,
+                "description": cls.output_tool_description,
+                "input_schema": schema_for(cls.output_model)
+            }
+            cls.tool_params = {
+                "tools": [tool],
+                "tool_choice": {"type": "tool", "name": cls.output_tool_name}
+            }
+
+    def __init__(
+        self,
+        client: Anthropic,
+        model: str = "claude-sonnet-4-20250514",
+        async_client: Optional[AsyncAnthropic] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
+        self.client = client
+        self.model = model
+        self.async_client = async_client
+        self.semaphore = semaphore
+        self.is_complete = False
+        # 요약된 대화 구간: conversation_history[pinned_messages:_summarized_until]
+        self._summary = ""
+        self._summarized_until = 0
+
+    def force_complete(self):
+        """강제로 단계 완료 처리"""
+        self.is_complete = True
+
+    _extract_json = staticmethod(extract_json)
+
+    def _cached_complete(self, request: dict, no_cache: bool = False) -> Tuple[str, Optional[str]]:
+        """
+        응답 캐시를 거쳐 API 호출
+
+        Returns:
+            Tuple[str, Optional[str]]: (응답 텍스트, 저장할 캐시 키 - 캐시 적중 시 None)
+        """
+        cache_key = _llm_cache.make_key(request)
+        if not no_cache:
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                return cached, None
+
+        return self._stream_output(request), cache_key
+
+    async def _acached_complete(self, request: dict, no_cache: bool = False) -> Tuple[str, Optional[str]]:
+        """응답 캐시를 거쳐 API 호출 (비동기)"""
+        cache_key = _llm_cache.make_key(request)
+        if not no_cache:
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                return cached, None
+
+        return await self._astream_output(request), cache_key
+
+    def _stream_output(self, request: dict) -> str:
+        """결과 JSON이 닫히는 즉시 스트림을 종료하고 반환"""
+        with self.client.messages.stream(**request) as stream:
+            return read_json_object(_output_chunks(stream))
+
+    async def _astream_output(self, request: dict) -> str:
+        """결과 JSON이 닫히는 즉시 스트림을 종료하고 반환 (비동기)"""
+        async with self.semaphore or nullcontext():
+            async with self.async_client.messages.stream(**request) as stream:
+                return await aread_json_object(_aoutput_chunks(stream))
+
+    def _validate(self, response_text: str) -> BaseModel:
+        """응답 텍스트에서 JSON을 추출해 output_model로 검증"""
+        # 도구 입력도 JSON 문자열로 받아 dict를 거치지 않고 바로 검증 (pydantic-core)
+        # 중첩 모델까지 검증해야 하므로 model_construct 대신 model_validate_json 사용
+        return self.output_model.model_validate_json(self._extract_json(response_text))
+
+    def _repair_request(self, broken: str, error: ValidationError) -> dict:
+        """JSON 복구 요청 파라미터 구성"""
+        return {
+            "model": REPAIR_MODEL,
+            "max_tokens": 3000,
+            "system": JSON_REPAIR_PROMPT,
+            "messages": [{
+                "role": "user",
+                "content": f"오류:\n{error}\n\n손상된 JSON:\n{broken}"
+            }],
+            **self.tool_params
+        }
+
+    def _repair_json(self, broken: str, error: ValidationError) -> Optional[str]:
+        """저렴한 모델로 스키마에 맞게 JSON 복구 (실패 시 None)"""
+        try:
+            response = self.client.messages.create(**self._repair_request(broken, error))
+        except APIError as e:
+            print(f"JSON 복구 요청 오류: {e}")
+            return None
+        return response_output(response)
+
+    async def _arepair_json(self, broken: str, error: ValidationError) -> Optional[str]:
+        """저렴한 모델로 스키마에 맞게 JSON 복구 (비동기)"""
+        try:
+            async with self.semaphore or nullcontext():
+                response = await self.async_client.messages.create(**self._repair_request(broken, error))
+        except APIError as e:
+            print(f"JSON 복구 요청 오류: {e}")
+            return None
+        return response_output(response)
+
+    def _validate_or_repair(self, response_text: str) -> Tuple[Optional[BaseModel], str]:
+        """
+        응답 검증, 실패하면 한 번 복구 후 재검증
+
+        Returns:
+            Tuple[Optional[BaseModel], str]: (검증된 결과 - 최종 실패 시 None, 검증에 성공한 텍스트)
+        """
+        try:
+            return self._validate(response_text), response_text
+        except ValidationError as e:
+            print(f"JSON 파싱 오류: {e}")
+            error = e
+
+        # JSON이 전혀 없으면(빈 응답 등) 복구할 내용도 없음
+        if "{" not in response_text:
+            return None, response_text
+
+        return self._validate_repaired(self._repair_json(response_text, error), response_text)
+
+    async def _avalidate_or_repair(self, response_text: str) -> Tuple[Optional[BaseModel], str]:
+        """응답 검증, 실패하면 한 번 복구 후 재검증 (비동기)"""
+        try:
+            return self._validate(response_text), response_text
+        except ValidationError as e:
+            print(f"JSON 파싱 오류: {e}")
+            error = e
+
+        # JSON이 전혀 없으면(빈 응답 등) 복구할 내용도 없음
+        if "{" not in response_text:
+            return None, response_text
+
+        return self._validate_repaired(await self._arepair_json(response_text, error), response_text)
+
+    def _validate_repaired(
+        self, repaired: Optional[str], response_text: str
+    ) -> Tuple[Optional[BaseModel], str]:
+        """복구된 JSON 재검증"""
+        if repaired is None:
+            return None, response_text
+
+        try:
+            return self._validate(repaired), repaired
+        except ValidationError as e:
+            print(f"JSON 복구 실패: {e}")
+            return None, response_text
+
+    def _windowed_history(self) -> List[dict]:
+        """
+        API에 보낼 대화 구성
+
+        앞쪽 pinned_messages개 메시지와 최근 턴은 그대로 두고,
+        그 사이의 대화는 누적 요약 메시지 하나로 대체합니다.
+        """
+        history = self.conversation_history
+        if not self._summary:
+            return self._with_cache_breakpoint(history)
+
+        # 요약 메시지도 캐시 브레이크포인트로 지정해 다음 턴에서 재사용
+        summary_message = {
+            "role": "user",
+            "content": [{
+                "type": "text",
+                "text": f"[이전 대화 요약]\n{self._summary}",
+                "cache_control": _CACHE_CONTROL
+            }]
+        }
+        return (
+            history[:self.pinned_messages]
+            + [summary_message]
+            + self._with_cache_breakpoint(history[self._summarized_until:])
+        )
+
+    def _compaction_request(self) -> Optional[Tuple[dict, int]]:
+        """
+        요약이 필요하면 요약 요청 파라미터와 새 요약 경계를 반환
+
+        요약하지 않은 구간이 MAX_TURNS_VERBATIM 턴을 넘으면, 최근 절반만 남기고
+        나머지를 요약합니다. 매 턴마다 요약하지 않으므로 요약 메시지가
+        여러 턴 동안 같은 prefix로 캐시됩니다.
+        """
+        history = self.conversation_history
+        start = max(self._summarized_until, self.pinned_messages)
+        if len(history) - start <= 2 * MAX_TURNS_VERBATIM + 1:
+            return None
+
+        # 대화는 사용자 메시지로 끝나므로 경계는 항상 AI 응답 위치가 됨
+        until = len(history) - 2 * (MAX_TURNS_VERBATIM // 2)
+
+        lines = [
+            f"{'사용자' if msg['role'] == 'user' else self.speaker_label}: {msg['content']}"
+            for msg in history[start:until]
+        ]
+        transcript = "\n\n".join(lines)
+        if self._summary:
+            transcript = f"## 이전 요약\n{self._summary}\n\n## 새 대화\n{transcript}"
+
+        request = {
+            "model": SUMMARY_MODEL,
+            "max_tokens": 1024,
+            "system": self.summary_prompt,
+            "messages": [{"role": "user", "content": transcript}]
+        }
+        return request, until
+
+    def _compact_history(self):
+        """오래된 대화를 누적 요약으로 압축"""
+        compaction = self._compaction_request()
+        if compaction is None:
+            return
+
+        request, until = compaction
+        try:
+            response = self.client.messages.create(**request)
+        except APIError as e:
+            # 요약에 실패하면 이번 턴은 전체 대화를 그대로 전송
+            print(f"대화 요약 오류: {e}")
+            return
+
+        self._summary = response.content[0].text
+        self._summarized_until = until
+
+    async def _acompact_history(self):
+        """오래된 대화를 누적 요약으로 압축 (비동기)"""
+        compaction = self._compaction_request()
+        if compaction is None:
+            return
+
+        request, until = compaction
+        try:
+            async with self.semaphore or nullcontext():
+                response = await self.async_client.messages.create(**request)
+        except APIError as e:
+            print(f"대화 요약 오류: {e}")
+            return
+
+        self._summary = response.content[0].text
+        self._summarized_until = until
+
+    @staticmethod
+    def _with_cache_breakpoint(messages: List[dict]) -> List[dict]:
+        """
+        마지막 메시지에 캐시 브레이크포인트 지정
+
+        다음 턴에서 이전 대화 전체가 캐시된 prefix로 재사용됩니다.
+        """
+        *history, last = messages
+        return history + [{
+            "role": last["role"],
+            "content": [{"type": "text", "text": last["content"], "cache_control": _CACHE_CONTROL}]
+        }]
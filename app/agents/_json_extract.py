@@ -0,0 +1,132 @@
+"""
+JSON block extraction shared by the SECI agents.
+"""
+
+import re
+from typing import AsyncIterable, Iterable
+
+# ```json { ... } ``` 블록 또는 첫 '{'부터 마지막 '}'까지를 한 번의 탐색으로 찾음
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+
+def extract_json(text: str) -> str:
+    """
+    텍스트에서 JSON 블록 추출
+
+    Args:
+        text: LLM 응답 텍스트
+
+    Returns:
+        추출된 JSON 문자열 (찾지 못하면 원본 텍스트)
+    """
+    # 응답 전체가 JSON 객체인 경우 정규식 탐색 생략
+    if text.startswith("{") and text.endswith("}"):
+        return text
+
+    match = _JSON_BLOCK.search(text)
+    if match:
+        return match.group(1) or match.group(2)
+
+    return text
+
+
+# 문자열 밖에서는 중괄호와 따옴표, 문자열 안에서는 따옴표와 역슬래시만 의미가 있음
+_STRUCTURAL = re.compile(r'[{}"\\]')
+
+
+class JsonObjectScanner:
+    """
+    스트리밍 응답에서 첫 번째 최상위 JSON 객체를 찾는 증분 스캐너
+
+    조각(chunk)을 받을 때마다 구조 문자만 훑어 중괄호 깊이를 추적하고,
+    첫 '{'에 대응하는 '}'가 닫히는 즉시 완료를 알립니다.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._offset = 0
+        self._start = -1
+        self._end = -1
+        self._depth = 0
+        self._in_string = False
+        self._skip = -1  # 역슬래시 다음 문자의 위치
+
+    @property
+    def done(self) -> bool:
+        return self._end >= 0
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트"""
+        return "".join(self._parts)
+
+    @property
+    def result(self) -> str:
+        """완성된 JSON 객체 문자열 (완료 전에는 전체 텍스트)"""
+        if not self.done:
+            return self.text
+        return self.text[self._start:self._end]
+
+    def feed(self, chunk: str) -> bool:
+        """
+        응답 조각 추가
+
+        Returns:
+            bool: 최상위 JSON 객체가 닫혔으면 True
+        """
+        if self.done:
+            return True
+
+        offset = self._offset
+        self._parts.append(chunk)
+        self._offset += len(chunk)
+
+        for match in _STRUCTURAL.finditer(chunk):
+            pos = offset + match.start()
+            char = match.group()
+
+            if self._start < 0:
+                # 첫 '{' 전의 설명 문장은 무시
+                if char == "{":
+                    self._start = pos
+                    self._depth = 1
+            elif self._in_string:
+                if pos == self._skip:
+                    continue
+                if char == "\\":
+                    self._skip = pos + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = pos + 1
+                    return True
+
+        return False
+
+
+def read_json_object(chunks: Iterable[str]) -> str:
+    """
+    스트림에서 첫 JSON 객체가 닫힐 때까지만 읽기
+
+    객체가 완성되지 않으면 전체 텍스트를 반환하므로 extract_json 경로로 이어집니다.
+    """
+    scanner = JsonObjectScanner()
+    for chunk in chunks:
+        if scanner.feed(chunk):
+            break
+    return scanner.result
+
+
+async def aread_json_object(chunks: AsyncIterable[str]) -> str:
+    """스트림에서 첫 JSON 객체가 닫힐 때까지만 읽기 (비동기)"""
+    scanner = JsonObjectScanner()
+    async for chunk in chunks:
+        if scanner.feed(chunk):
+            break
+    return scanner.result
@@ -0,0 +1,106 @@
+"""
+LLM Response Cache
+
+Exact-match cache for one-shot generation calls (Combiner, Internalizer).
+Responses are keyed by SHA-256 over the canonical request parameters and
+persisted in SQLite so repeated runs on the same input skip the API call.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+# 프롬프트를 수정하면 버전을 올려 기존 캐시를 무효화
+PROMPT_VERSION = "v2"
+
+# 기본 TTL: 7일
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+CACHE_PATH = os.getenv(
+    "TACIT_LLM_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "tacit", "llm_cache.sqlite3")
+)
+
+
+def _connect() -> sqlite3.Connection:
+    """캐시 DB 연결 (테이블이 없으면 생성)"""
+    cache_dir = os.path.dirname(CACHE_PATH)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "hash TEXT PRIMARY KEY, "
+        "response TEXT NOT NULL, "
+        "created_at INTEGER NOT NULL, "
+        "expires_at INTEGER NOT NULL)"
+    )
+    return conn
+
+
+def make_key(request: Dict[str, Any]) -> str:
+    """
+    요청 파라미터로 캐시 키 생성
+
+    Args:
+        request: messages.create에 전달할 파라미터 (model, system, messages 등)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    canonical = json.dumps(
+        {"prompt_version": PROMPT_VERSION, **request},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """
+    캐시된 응답 조회
+
+    Args:
+        key: make_key로 만든 캐시 키
+
+    Returns:
+        캐시된 응답 텍스트 또는 None (없거나 만료된 경우)
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE hash = ? AND expires_at > ?",
+                (key, int(time.time()))
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"LLM 캐시 조회 오류: {e}")
+        return None
+
+    return row[0] if row else None
+
+
+def set(key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+    """
+    응답 저장
+
+    Args:
+        key: make_key로 만든 캐시 키
+        value: 응답 텍스트
+        ttl: 유효 기간 (초)
+    """
+    now = int(time.time())
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (hash, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now + ttl)
+            )
+    except sqlite3.Error as e:
+        print(f"LLM 캐시 저장 오류: {e}")
@@ -0,0 +1,158 @@
+"""
+Semantic Response Cache
+
+Near-duplicate cache for conversation-derived generations (Experience Map).
+Conversations are reduced to character-trigram frequency vectors and a
+stored result is reused when its cosine similarity to the new conversation
+reaches the threshold. Entries share the SQLite file of the exact-match
+LLM cache and are loaded into an in-process index on first lookup.
+
+Opt-in: set TACIT_SEMANTIC_CACHE=1. A hit returns a result generated for a
+different (but very similar) conversation.
+"""
+
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
+from agents import _llm_cache
+
+ENABLED = os.getenv("TACIT_SEMANTIC_CACHE", "") == "1"
+
+# 이 값 이상으로 비슷한 대화면 저장된 결과를 재사용
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_TTL = _llm_cache.DEFAULT_TTL
+
+# 한국어는 띄어쓰기가 불규칙하므로 단어 대신 문자 3-gram 사용
+NGRAM = 3
+_WHITESPACE = re.compile(r"\s+")
+
+Vector = Dict[str, float]
+
+
+def embed(text: str) -> Vector:
+    """
+    텍스트를 정규화된 문자 n-gram 빈도 벡터로 변환
+
+    Args:
+        text: 대화 텍스트
+
+    Returns:
+        n-gram -> 가중치 (L2 norm = 1)
+    """
+    text = _WHITESPACE.sub(" ", text.strip().lower())
+    counts = Counter(text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1))
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    if not norm:
+        return {}
+    return {gram: c / norm for gram, c in counts.items()}
+
+
+def cosine(a: Vector, b: Vector) -> float:
+    """정규화된 두 벡터의 코사인 유사도"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+
+
+class SemanticCache:
+    """유사한 대화에 대한 생성 결과 캐시"""
+
+    def __init__(
+        self,
+        namespace: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: int = DEFAULT_TTL,
+        enabled: bool = ENABLED
+    ):
+        # 프롬프트 버전이 바뀌면 이전 결과를 쓰지 않도록 네임스페이스에 포함
+        self.namespace = f"{namespace}:{_llm_cache.PROMPT_VERSION}"
+        self.threshold = threshold
+        self.ttl = ttl
+        self.enabled = enabled
+        # (벡터, 결과, 만료 시각) - 첫 조회 시 DB에서 불러옴
+        self._index: Optional[List[Tuple[Vector, str, int]]] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """캐시 DB 연결 (테이블이 없으면 생성)"""
+        conn = _llm_cache._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_cache ("
+            "namespace TEXT NOT NULL, "
+            "vector TEXT NOT NULL, "
+            "response TEXT NOT NULL, "
+            "created_at INTEGER NOT NULL, "
+            "expires_at INTEGER NOT NULL)"
+        )
+        return conn
+
+    def _load(self) -> List[Tuple[Vector, str, int]]:
+        """만료되지 않은 항목을 메모리 인덱스로 불러오기"""
+        if self._index is None:
+            try:
+                with closing(self._connect()) as conn:
+                    rows = conn.execute(
+                        "SELECT vector, response, expires_at FROM semantic_cache "
+                        "WHERE namespace = ? AND expires_at > ?",
+                        (self.namespace, int(time.time()))
+                    ).fetchall()
+            except sqlite3.Error as e:
+                print(f"시맨틱 캐시 조회 오류: {e}")
+                rows = []
+            self._index = [(orjson.loads(vector), response, expires) for vector, response, expires in rows]
+        return self._index
+
+    def get(self, text: str) -> Optional[str]:
+        """
+        가장 비슷한 대화의 결과 조회
+
+        Args:
+            text: 대화 텍스트
+
+        Returns:
+            저장된 결과 또는 None (비활성화, 없음, 유사도 미달)
+        """
+        if not self.enabled:
+            return None
+
+        vector = embed(text)
+        now = int(time.time())
+        best, best_score = None, self.threshold
+        for stored, response, expires_at in self._load():
+            if expires_at <= now:
+                continue
+            score = cosine(vector, stored)
+            if score >= best_score:
+                best, best_score = response, score
+        return best
+
+    def put(self, text: str, value: str) -> None:
+        """
+        결과 저장
+
+        Args:
+            text: 대화 텍스트
+            value: 생성 결과 (JSON 문자열)
+        """
+        if not self.enabled:
+            return
+
+        vector = embed(text)
+        now = int(time.time())
+        self._load().append((vector, value, now + self.ttl))
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT INTO semantic_cache (namespace, vector, response, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, orjson.dumps(vector).decode(), value, now, now + self.ttl)
+                )
+        except sqlite3.Error as e:
+            print(f"시맨틱 캐시 저장 오류: {e}")
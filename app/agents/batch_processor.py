@@ -0,0 +1,90 @@
+"""
+Batch Processor - Message Batches API
+
+Runs one-shot, non-interactive generations (Combiner, Internalizer) through
+Anthropic's Message Batches API, which is billed at half the regular price.
+Interactive phases (Socializer, Externalizer) stay on the regular endpoint.
+"""
+
+import asyncio
+from typing import List
+
+from anthropic import AsyncAnthropic
+
+from agents import _llm_cache
+from agents._base import response_output
+
+# 배치 상태 폴링 간격 (초) - 지수 백오프
+INITIAL_POLL_INTERVAL = 5.0
+MAX_POLL_INTERVAL = 60.0
+
+
+async def submit_batch(client: AsyncAnthropic, requests: List[dict]) -> List[str]:
+    """
+    여러 요청을 하나의 배치로 제출하고 완료될 때까지 대기
+
+    Args:
+        client: 비동기 Anthropic 클라이언트
+        requests: messages.create에 전달할 파라미터 목록
+
+    Returns:
+        List[str]: 요청 순서와 같은 순서의 응답 텍스트 (실패한 요청은 빈 문자열)
+    """
+    batch = await client.messages.batches.create(requests=[
+        {"custom_id": f"request-{i}", "params": params}
+        for i, params in enumerate(requests)
+    ])
+
+    interval = INITIAL_POLL_INTERVAL
+    while batch.processing_status != "ended":
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    results = [""] * len(requests)
+    async for entry in await client.messages.batches.results(batch.id):
+        index = int(entry.custom_id.rsplit("-", 1)[1])
+        if entry.result.type == "succeeded":
+            results[index] = response_output(entry.result.message)
+        else:
+            print(f"배치 요청 실패 ({entry.custom_id}): {entry.result.type}")
+
+    return results
+
+
+async def run_batch(client: AsyncAnthropic, agents: list) -> list:
+    """
+    여러 Agent의 생성 요청을 한 번의 배치로 실행
+
+    각 Agent는 입력(set_knowledge_spec / set_business_card)이 설정되어 있어야 하며,
+    응답 캐시에 있는 요청은 배치에서 제외됩니다.
+
+    Args:
+        client: 비동기 Anthropic 클라이언트
+        agents: batch_eligible한 Agent 목록 (Combiner, Internalizer)
+
+    Returns:
+        list: Agent 순서대로 생성된 산출물
+    """
+    for agent in agents:
+        if not getattr(agent, "batch_eligible", False):
+            raise ValueError(f"{type(agent).__name__}은(는) 배치 처리를 지원하지 않습니다.")
+
+    requests = [agent._build_request() for agent in agents]
+    cache_keys = [_llm_cache.make_key(request) for request in requests]
+    texts = [_llm_cache.get(key) for key in cache_keys]
+
+    # 캐시에 없는 요청만 배치로 제출하고, 새 응답만 캐시에 저장
+    pending = [i for i, text in enumerate(texts) if text is None]
+    store_keys = [None] * len(agents)
+    if pending:
+        batch_texts = await submit_batch(client, [requests[i] for i in pending])
+        for i, text in zip(pending, batch_texts):
+            texts[i] = text
+            store_keys[i] = cache_keys[i]
+
+    outputs = []
+    for agent, text, cache_key in zip(agents, texts, store_keys):
+        result, text = await agent._avalidate_or_repair(text)
+        outputs.append(agent._apply_result(result, text, cache_key))
+    return outputs
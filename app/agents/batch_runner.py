@@ -0,0 +1,169 @@
+"""
+Batch Runner - dataset-scale generation
+
+Runs one agent type over many inputs (e.g. offline evaluation across many
+sessions), either concurrently against the regular endpoint or through the
+Message Batches API (see batch_processor). BatchedTransducer collects
+individual requests arriving from many callers and flushes them together.
+"""
+
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence, Set, Tuple
+
+from anthropic import Anthropic, AsyncAnthropic
+
+from agents.batch_processor import run_batch
+
+# 기본 동시 호출 수
+DEFAULT_CONCURRENCY = 8
+
+# BatchedTransducer 기본값: 16개가 모이거나 50ms가 지나면 실행
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+
+async def run_batch_async(
+    agent_cls: type,
+    client: Anthropic,
+    async_client: AsyncAnthropic,
+    inputs: Sequence[Any],
+    setter: Callable[[Any, Any], None],
+    method: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    batch_api: bool = False
+) -> List[Any]:
+    """
+    입력마다 Agent를 하나씩 만들어 생성 메서드를 실행
+
+    예: run_batch_async(Combiner, client, async_client, specs,
+                        Combiner.set_knowledge_spec, "agenerate_business_card")
+
+    Args:
+        agent_cls: Agent 클래스 (Combiner, Internalizer 등)
+        client: 동기 Anthropic 클라이언트
+        async_client: 비동기 Anthropic 클라이언트 (모든 Agent가 공유)
+        inputs: Agent별 입력 목록
+        setter: 입력을 Agent에 설정하는 함수 (예: Combiner.set_knowledge_spec)
+        method: 실행할 비동기 생성 메서드 이름
+        concurrency: 동시에 실행할 최대 API 호출 수
+        batch_api: True면 Message Batches API로 한 번에 제출 (batch_eligible Agent만 가능)
+
+    Returns:
+        List[Any]: 입력 순서대로 생성된 산출물
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    agents = []
+    for value in inputs:
+        agent = agent_cls(client, async_client=async_client, semaphore=semaphore)
+        setter(agent, value)
+        agents.append(agent)
+
+    if batch_api:
+        return await run_batch(async_client, agents)
+
+    # 동시 호출 수는 각 Agent가 공유 세마포어로 제한
+    return list(await asyncio.gather(*(getattr(agent, method)() for agent in agents)))
+
+
+class BatchedTransducer:
+    """
+    개별 생성 요청을 모아 한 번에 실행하는 비동기 버퍼
+
+    submit()으로 들어온 입력을 batch_size개가 모이거나 flush_interval초가 지나면
+    run_batch_async로 함께 실행하고, 결과를 입력 순서대로 각 호출자에게 돌려줍니다.
+
+    예: cards = BatchedTransducer(Combiner, client, async_client,
+                                  Combiner.set_knowledge_spec, "agenerate_business_card")
+        card = await cards.submit(knowledge_spec)
+    """
+
+    def __init__(
+        self,
+        agent_cls: type,
+        client: Anthropic,
+        async_client: AsyncAnthropic,
+        setter: Callable[[Any, Any], None],
+        method: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        concurrency: int = DEFAULT_BATCH_SIZE,
+        batch_api: bool = False
+    ):
+        self.agent_cls = agent_cls
+        self.client = client
+        self.async_client = async_client
+        self.setter = setter
+        self.method = method
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.concurrency = concurrency
+        self.batch_api = batch_api
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def submit(self, value: Any) -> Any:
+        """
+        입력 하나를 버퍼에 넣고 결과를 기다림
+
+        Args:
+            value: Agent 입력 (setter로 설정할 값)
+
+        Returns:
+            Any: 생성된 산출물
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((value, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._flush_pending)
+
+        return await future
+
+    async def flush(self):
+        """버퍼에 남은 입력을 바로 실행하고 진행 중인 배치가 끝날 때까지 대기"""
+        self._flush_pending()
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def _flush_pending(self):
+        """모인 입력을 하나의 배치로 실행 시작"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """배치 실행 후 결과를 각 호출자에게 전달"""
+        try:
+            outputs = await run_batch_async(
+                self.agent_cls,
+                self.client,
+                self.async_client,
+                [value for value, _ in batch],
+                self.setter,
+                self.method,
+                concurrency=self.concurrency,
+                batch_api=self.batch_api
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), output in zip(batch, outputs):
+            if not future.done():
+                future.set_result(output)
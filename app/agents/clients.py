@@ -0,0 +1,61 @@
+"""
+Anthropic API Clients
+
+All agents in a session should share the clients created here: each
+Anthropic/AsyncAnthropic instance owns its own httpx connection pool, so one
+shared client pays the TLS handshake once and keeps the connection alive
+(the async client also multiplexes concurrent requests over HTTP/2).
+"""
+
+from importlib.util import find_spec
+
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
+
+# 동시 요청(배치/병렬 생성)을 감당할 연결 풀 크기
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+
+# HTTP/2는 h2 패키지가 있을 때만 사용 (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+MAX_RETRIES = 2
+
+
+def _limits() -> httpx.Limits:
+    """연결 풀 크기 설정"""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+def create_client(api_key: str) -> Anthropic:
+    """
+    연결 풀을 유지하는 동기 Anthropic 클라이언트 생성
+
+    Streamlit처럼 스크립트가 매번 다시 실행되는 환경에서는 세션 상태에 보관해
+    재사용해야 keep-alive 연결이 유지됩니다.
+
+    Args:
+        api_key: Anthropic API 키
+
+    Returns:
+        Anthropic: keep-alive 연결 풀을 사용하는 클라이언트
+    """
+    http_client = DefaultHttpxClient(http2=HTTP2_AVAILABLE, limits=_limits())
+    return Anthropic(api_key=api_key, http_client=http_client, max_retries=MAX_RETRIES)
+
+
+def create_async_client(api_key: str) -> AsyncAnthropic:
+    """
+    연결 풀을 공유하는 비동기 Anthropic 클라이언트 생성
+
+    Args:
+        api_key: Anthropic API 키
+
+    Returns:
+        AsyncAnthropic: HTTP/2 연결 풀을 사용하는 클라이언트
+    """
+    http_client = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE, limits=_limits())
+    return AsyncAnthropic(api_key=api_key, http_client=http_client, max_retries=MAX_RETRIES)
@@ -7,10 +7,11 @@ Analyzes externalized knowledge and connects it to business opportunities.
 Creates Business Opportunity Cards as output.
 """
 
-import json
 from typing import Optional
-from anthropic import Anthropic
+import orjson
 
+from agents import _llm_cache
+from agents._base import BaseAgent, _CACHE_CONTROL
 from prompts.seci_prompts import (
     COMBINER_SYSTEM_PROMPT,
     COMBINER_BUSINESS_CARD_PROMPT
@@ -25,7 +26,41 @@ from models.knowledge import (
 )
 
 
-class Combiner:
+# 정적 프롬프트는 Anthropic 프롬프트 캐시로 재사용
+_SYSTEM = [{"type": "text", "text": COMBINER_SYSTEM_PROMPT, "cache_control": _CACHE_CONTROL}]
+
+# 가변 데이터 블록의 고정 앞/뒤 부분 (요청마다 입력 JSON만 이어 붙임)
+_SPEC_BLOCK_PREFIX = "다음은 표출화 단계에서 생성된 암묵지 명세서입니다:\n\n```json\n"
+_SPEC_BLOCK_SUFFIX = "\n```"
+
+# 점수(0~5)별 별점 문자열
+_STARS = tuple("★" * n + "☆" * (5 - n) for n in range(6))
+
+# 파싱 실패 시 사용할 기본 카드 (고정값이므로 검증 없이 한 번만 생성)
+# model_copy()는 얕은 복사이므로 하위 항목(dict)은 수정하지 않습니다.
+_FALLBACK_CARD_TEMPLATE = BusinessOpportunityCard.model_construct(
+    knowledge_asset=KnowledgeAssetScore(
+        name="미확인",
+        scarcity_score=3,
+        demand_score=3,
+        transferability_score=3
+    ),
+    business_opportunities=[
+        BusinessOpportunity.model_construct(
+            opportunity_name="추가 분석 필요",
+            type=BusinessOpportunityType.KNOWLEDGE_TRANSFER,
+            target_customer="추가 분석 필요",
+            value_proposition="추가 분석 필요",
+            product_format="추가 분석 필요",
+            difficulty=TransferDifficulty.MEDIUM,
+            first_step="비즈니스 기회 분석을 다시 시도해주세요"
+        )
+    ],
+    recommended_opportunity="추가 분석이 필요합니다"
+)
+
+
+class Combiner(BaseAgent):
     """
     연결자 Agent - 연결화 단계를 담당
 
@@ -36,107 +71,109 @@ class Combiner:
     - 비즈니스 기회 카드 3개 생성
     """
 
-    def __init__(self, client: Anthropic, model: str = "claude-sonnet-4-20250514"):
-        self.client = client
-        self.model = model
+    # 비대화형 단일 호출이므로 Message Batches API로 처리 가능
+    batch_eligible = True
+    output_model = BusinessOpportunityCard
+    output_tool_name = "emit_business_card"
+    output_tool_description = "암묵지 명세서를 분석한 비즈니스 기회 카드를 기록합니다."
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.knowledge_spec: Optional[TacitKnowledgeSpec] = None
+        self._knowledge_spec_json: Optional[str] = None
         self.business_card: Optional[BusinessOpportunityCard] = None
-        self.is_complete = False
 
     def reset(self):
         """초기화"""
         self.knowledge_spec = None
+        self._knowledge_spec_json = None
         self.business_card = None
         self.is_complete = False
 
     def set_knowledge_spec(self, knowledge_spec: TacitKnowledgeSpec):
         """암묵지 명세서 설정"""
         self.knowledge_spec = knowledge_spec
+        # 요청마다 다시 직렬화하지 않도록 프롬프트용 JSON을 미리 생성
+        self._knowledge_spec_json = orjson.dumps(
+            knowledge_spec.model_dump(), option=orjson.OPT_INDENT_2
+        ).decode()
 
-    def generate_business_card(self) -> BusinessOpportunityCard:
+    def generate_business_card(self, no_cache: bool = False) -> BusinessOpportunityCard:
         """
         비즈니스 기회 카드 생성
 
+        Args:
+            no_cache: True면 응답 캐시를 무시하고 새로 생성
+
         Returns:
             BusinessOpportunityCard: 생성된 비즈니스 기회 카드
         """
-        if not self.knowledge_spec:
-            raise ValueError("암묵지 명세서가 설정되지 않았습니다.")
-
-        # 암묵지 명세서를 프롬프트에 포함
-        knowledge_spec_json = self.knowledge_spec.model_dump_json(indent=2)
+        response_text, cache_key = self._cached_complete(self._build_request(), no_cache)
+        result, response_text = self._validate_or_repair(response_text)
+        return self._apply_result(result, response_text, cache_key)
 
-        prompt = f"""다음은 표출화 단계에서 생성된 암묵지 명세서입니다:
-
-```json
-{knowledge_spec_json}
-```
+    async def agenerate_business_card(self, no_cache: bool = False) -> BusinessOpportunityCard:
+        """
+        비즈니스 기회 카드 생성 (비동기)
 
-{COMBINER_BUSINESS_CARD_PROMPT}"""
+        async_client가 설정되어 있어야 합니다.
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=3000,
-            system=COMBINER_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        Args:
+            no_cache: True면 응답 캐시를 무시하고 새로 생성
 
-        response_text = response.content[0].text
-        json_str = self._extract_json(response_text)
+        Returns:
+            BusinessOpportunityCard: 생성된 비즈니스 기회 카드
+        """
+        response_text, cache_key = await self._acached_complete(self._build_request(), no_cache)
+        result, response_text = await self._avalidate_or_repair(response_text)
+        return self._apply_result(result, response_text, cache_key)
 
-        try:
-            data = json.loads(json_str)
-            self.business_card = BusinessOpportunityCard(**data)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"JSON 파싱 오류: {e}")
-            self.business_card = self._create_fallback_card()
+    def _build_request(self) -> dict:
+        """비즈니스 기회 카드 생성 요청 파라미터 구성"""
+        if not self.knowledge_spec:
+            raise ValueError("암묵지 명세서가 설정되지 않았습니다.")
 
-        self.is_complete = True
-        return self.business_card
+        # 암묵지 명세서를 프롬프트에 포함 (set_knowledge_spec에서 직렬화해 둔 값)
+        knowledge_spec_json = self._knowledge_spec_json
 
-    def _extract_json(self, text: str) -> str:
-        """텍스트에서 JSON 블록 추출"""
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
+        # 정적 지시문(캐시 대상)을 먼저, 가변 데이터는 그 뒤에 배치
+        content = [
+            {"type": "text", "text": COMBINER_BUSINESS_CARD_PROMPT, "cache_control": _CACHE_CONTROL},
+            {"type": "text", "text": _SPEC_BLOCK_PREFIX + knowledge_spec_json + _SPEC_BLOCK_SUFFIX}
+        ]
 
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
+        return {
+            "model": self.model,
+            "max_tokens": 3000,
+            "system": _SYSTEM,
+            "messages": [{"role": "user", "content": content}],
+            **self.tool_params
+        }
+
+    def _apply_result(
+        self, result: Optional[BusinessOpportunityCard], response_text: str, cache_key: Optional[str] = None
+    ) -> BusinessOpportunityCard:
+        """
+        검증 결과를 비즈니스 기회 카드로 반영 (최종 실패 시 기본값)
 
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
-            return text[start:end]
+        검증에 성공한 응답(복구된 경우 복구된 JSON)만 cache_key로 캐시에 저장합니다.
+        """
+        if result is None:
+            result = self._create_fallback_card()
+        elif cache_key:
+            _llm_cache.set(cache_key, response_text)
 
-        return text
+        self.business_card = result
+        self.is_complete = True
+        return self.business_card
 
     def _create_fallback_card(self) -> BusinessOpportunityCard:
         """파싱 실패 시 기본 비즈니스 기회 카드 생성"""
-        return BusinessOpportunityCard(
-            knowledge_asset=KnowledgeAssetScore(
-                name=self.knowledge_spec.knowledge_name if self.knowledge_spec else "미확인",
-                scarcity_score=3,
-                demand_score=3,
-                transferability_score=3
-            ),
-            business_opportunities=[
-                BusinessOpportunity(
-                    opportunity_name="추가 분석 필요",
-                    type=BusinessOpportunityType.KNOWLEDGE_TRANSFER,
-                    target_customer="추가 분석 필요",
-                    value_proposition="추가 분석 필요",
-                    product_format="추가 분석 필요",
-                    difficulty=TransferDifficulty.MEDIUM,
-                    first_step="비즈니스 기회 분석을 다시 시도해주세요"
-                )
-            ],
-            recommended_opportunity="추가 분석이 필요합니다"
-        )
+        if not self.knowledge_spec:
+            return _FALLBACK_CARD_TEMPLATE.model_copy()
+
+        asset = {**_FALLBACK_CARD_TEMPLATE.knowledge_asset, "name": self.knowledge_spec.knowledge_name}
+        return _FALLBACK_CARD_TEMPLATE.model_copy(update={"knowledge_asset": asset})
 
     def get_summary(self) -> str:
         """비즈니스 기회 카드 요약 반환"""
@@ -146,34 +183,26 @@ class Combiner:
         card = self.business_card
         asset = card.knowledge_asset
 
-        summary_parts = [
-            f"## 지식 자산: {asset.name}",
-            f"- 희소성: {'★' * asset.scarcity_score}{'☆' * (5 - asset.scarcity_score)}",
-            f"- 수요: {'★' * asset.demand_score}{'☆' * (5 - asset.demand_score)}",
-            f"- 전달가능성: {'★' * asset.transferability_score}{'☆' * (5 - asset.transferability_score)}",
-            "",
+        sections = [
+            f"## 지식 자산: {asset['name']}\n"
+            f"- 희소성: {_STARS[asset['scarcity_score']]}\n"
+            f"- 수요: {_STARS[asset['demand_score']]}\n"
+            f"- 전달가능성: {_STARS[asset['transferability_score']]}\n"
+            "\n"
             "## 비즈니스 기회"
         ]
 
-        for i, opp in enumerate(card.business_opportunities, 1):
-            summary_parts.extend([
-                f"\n### 기회 {i}: {opp.opportunity_name}",
-                f"- 유형: {opp.type.value}",
-                f"- 타겟: {opp.target_customer}",
-                f"- 가치: {opp.value_proposition}",
-                f"- 상품 형태: {opp.product_format}",
-                f"- 난이도: {opp.difficulty.value}",
-                f"- 첫 번째 행동: {opp.first_step}"
-            ])
-
-        summary_parts.extend([
-            "",
-            f"## 추천",
-            card.recommended_opportunity
-        ])
-
-        return "\n".join(summary_parts)
-
-    def force_complete(self):
-        """강제로 단계 완료 처리"""
-        self.is_complete = True
+        sections.extend(
+            f"\n### 기회 {i}: {opp.opportunity_name}\n"
+            f"- 유형: {opp.type.value}\n"
+            f"- 타겟: {opp.target_customer}\n"
+            f"- 가치: {opp.value_proposition}\n"
+            f"- 상품 형태: {opp.product_format}\n"
+            f"- 난이도: {opp.difficulty.value}\n"
+            f"- 첫 번째 행동: {opp.first_step}"
+            for i, opp in enumerate(card.business_opportunities, 1)
+        )
+
+        sections.append(f"\n## 추천\n{card.recommended_opportunity}")
+
+        return "\n".join(sections)
@@ -7,18 +7,53 @@ Uses Socratic dialogue to extract tacit knowledge and convert it
 into explicit knowledge. Creates Tacit Knowledge Specification as output.
 """
 
-import json
-from typing import List, Optional, Tuple
-from anthropic import Anthropic
+import re
+from contextlib import nullcontext
+from typing import AsyncIterator, Iterator, List, Optional, Set, Tuple
 
+from agents._base import BaseAgent, _CACHE_CONTROL
 from prompts.seci_prompts import (
     EXTERNALIZER_SYSTEM_PROMPT,
-    EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT
+    EXTERNALIZER_INITIAL_PROMPT,
+    EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT,
+    EXTERNALIZER_SUMMARY_PROMPT
 )
-from models.knowledge import ExperienceMap, TacitKnowledgeSpec
+from models.knowledge import ExperienceMap, TacitKnowledgeSpec, TransferDifficulty
 
 
-class Externalizer:
+# 정적 프롬프트는 Anthropic 프롬프트 캐시로 재사용
+_SYSTEM = [{"type": "text", "text": EXTERNALIZER_SYSTEM_PROMPT, "cache_control": _CACHE_CONTROL}]
+
+# 표출화에서 찾아야 할 키워드들 (한 번의 탐색으로 모두 매칭)
+KEYWORDS = (
+    "규칙", "패턴", "판단", "기준", "신호", "느낌",
+    "비유", "은유", "예외", "실수", "초보", "경험"
+)
+_KEYWORD_RE = re.compile("|".join(map(re.escape, KEYWORDS)))
+
+# 대화 응답 토큰 예산 (질문 위주의 짧은 응답)
+CHAT_MAX_TOKENS = 1024
+
+# 파싱 실패 시 사용할 기본 암묵지 명세서 (고정값이므로 검증 없이 한 번만 생성)
+# model_copy()는 얕은 복사이므로 하위 객체는 수정하지 않습니다.
+_FALLBACK_SPEC_TEMPLATE = TacitKnowledgeSpec.model_construct(
+    knowledge_name="추가 분석 필요",
+    summary="암묵지 명세서 생성을 위해 추가 분석이 필요합니다",
+    detailed_description="대화 내용을 바탕으로 암묵지 명세서를 생성하는 데 실패했습니다. "
+                        "추가 대화나 수동 분석이 필요합니다.",
+    trigger_signals=["미확인"],
+    decision_rules=["미확인"],
+    exceptions=["미확인"],
+    metaphor="미확인",
+    sensory_cues=[],
+    common_mistakes=[],
+    transfer_difficulty=TransferDifficulty.MEDIUM,
+    transfer_method="추가 분석 필요",
+    evidence_quotes=[]
+)
+
+
+class Externalizer(BaseAgent):
     """
     표출자 Agent - 표출화 단계를 담당
 
@@ -28,14 +63,25 @@ class Externalizer:
     - 암묵지 명세서(Tacit Knowledge Specification) 생성
     """
 
-    def __init__(self, client: Anthropic, model: str = "claude-sonnet-4-20250514"):
-        self.client = client
-        self.model = model
+    output_model = TacitKnowledgeSpec
+    output_tool_name = "emit_knowledge_spec"
+    output_tool_description = "대화에서 추출한 암묵지 명세서를 기록합니다."
+
+    # 대화 압축: 초기 프롬프트와 첫 응답은 항상 그대로 전송
+    pinned_messages = 2
+    speaker_label = "표출자"
+    summary_prompt = EXTERNALIZER_SUMMARY_PROMPT
+
+    def __init__(self, *args, max_tokens: int = CHAT_MAX_TOKENS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_tokens = max_tokens
         self.conversation_history: List[dict] = []
-        self.is_complete = False
         self.knowledge_spec: Optional[TacitKnowledgeSpec] = None
         self.experience_map: Optional[ExperienceMap] = None
         self.current_focus_area: Optional[str] = None
+        # 키워드 탐색은 conversation_history[_scanned_upto:]만 새로 훑음
+        self._keyword_hits: Set[str] = set()
+        self._scanned_upto = 0
 
     def reset(self):
         """대화 초기화"""
@@ -43,6 +89,10 @@ class Externalizer:
         self.is_complete = False
         self.knowledge_spec = None
         self.current_focus_area = None
+        self._keyword_hits = set()
+        self._scanned_upto = 0
+        self._summary = ""
+        self._summarized_until = 0
 
     def set_experience_map(self, experience_map: ExperienceMap):
         """경험 지도 설정"""
@@ -65,36 +115,57 @@ class Externalizer:
         if not self.experience_map:
             return "안녕하세요! 경험 지도를 먼저 설정해주세요."
 
-        focus = self.current_focus_area or "암묵지"
-
-        initial_prompt = f"""지금부터 '대화의 장(Dialoguing Ba)'을 시작합니다.
-
-경험 지도를 바탕으로, '{focus}' 영역을 깊이 탐색하겠습니다.
-
-경험 지도 정보:
-- 사용자: {self.experience_map.user_profile.role} ({self.experience_map.user_profile.experience_years} 경력)
-- 분야: {self.experience_map.user_profile.domain}
-- 탐색 영역: {focus}
-- 추천 이유: {self.experience_map.recommended_focus}
-
-이 영역에서 사용자의 암묵지를 끌어내기 위한 첫 질문을 해주세요.
-소크라테스식 대화법을 사용하고, 구체적인 상황을 물어보세요."""
+        initial_prompt = self._build_initial_prompt()
 
         # 시스템 프롬프트와 함께 초기 대화 생성
         response = self.client.messages.create(
             model=self.model,
             max_tokens=1024,
-            system=EXTERNALIZER_SYSTEM_PROMPT,
+            system=_SYSTEM,
             messages=[{"role": "user", "content": initial_prompt}]
         )
 
-        assistant_message = response.content[0].text
+        return self._start_conversation(initial_prompt, response.content[0].text)
+
+    async def aget_initial_message(self) -> str:
+        """초기 메시지 생성 (비동기)"""
+        if not self.experience_map:
+            return "안녕하세요! 경험 지도를 먼저 설정해주세요."
+
+        initial_prompt = self._build_initial_prompt()
+
+        async with self.semaphore or nullcontext():
+            response = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=1024,
+                system=_SYSTEM,
+                messages=[{"role": "user", "content": initial_prompt}]
+            )
+
+        return self._start_conversation(initial_prompt, response.content[0].text)
+
+    def _build_initial_prompt(self) -> str:
+        """초기 질문 생성용 프롬프트 구성"""
+        profile = self.experience_map.user_profile
 
-        # 대화 히스토리 시작
+        return EXTERNALIZER_INITIAL_PROMPT.format(
+            focus=self.current_focus_area or "암묵지",
+            role=profile.role,
+            experience_years=profile.experience_years,
+            domain=profile.domain,
+            recommended_focus=self.experience_map.recommended_focus
+        )
+
+    def _start_conversation(self, initial_prompt: str, assistant_message: str) -> str:
+        """대화 히스토리 시작"""
         self.conversation_history = [
             {"role": "user", "content": initial_prompt},
             {"role": "assistant", "content": assistant_message}
         ]
+        self._keyword_hits = set()
+        self._scanned_upto = 0
+        self._summary = ""
+        self._summarized_until = 0
 
         return assistant_message
 
@@ -108,22 +179,99 @@ class Externalizer:
         Returns:
             Tuple[str, bool]: (AI 응답, 단계 완료 여부)
         """
+        assistant_message = "".join(self.chat_stream(user_message))
+        return assistant_message, self.is_complete
+
+    def chat_stream(self, user_message: str) -> Iterator[str]:
+        """
+        사용자와 대화 (스트리밍)
+
+        응답을 생성되는 대로 yield하고, 스트림이 끝나면 대화 히스토리와
+        단계 완료 여부(is_complete)를 갱신합니다.
+
+        Args:
+            user_message: 사용자 메시지
+
+        Yields:
+            str: AI 응답 조각
+        """
         # 대화 히스토리에 사용자 메시지 추가
         self.conversation_history.append({
             "role": "user",
             "content": user_message
         })
 
-        # Claude API 호출
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2048,
-            system=EXTERNALIZER_SYSTEM_PROMPT,
-            messages=self.conversation_history
-        )
+        self._compact_history()
+
+        chunks = []
+        try:
+            # Claude API 스트리밍 호출
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                system=_SYSTEM,
+                messages=self._windowed_history()
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
+        except GeneratorExit:
+            # 중간에 중단되면 사용자 메시지를 되돌려 히스토리 순서 유지
+            self.conversation_history.pop()
+            raise
+
+        self._record_reply("".join(chunks))
+
+    async def achat(self, user_message: str) -> Tuple[str, bool]:
+        """
+        사용자와 대화 (비동기)
+
+        Args:
+            user_message: 사용자 메시지
+
+        Returns:
+            Tuple[str, bool]: (AI 응답, 단계 완료 여부)
+        """
+        chunks = [text async for text in self.achat_stream(user_message)]
+        return "".join(chunks), self.is_complete
 
-        assistant_message = response.content[0].text
+    async def achat_stream(self, user_message: str) -> AsyncIterator[str]:
+        """
+        사용자와 대화 (비동기 스트리밍)
 
+        Args:
+            user_message: 사용자 메시지
+
+        Yields:
+            str: AI 응답 조각
+        """
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_message
+        })
+
+        await self._acompact_history()
+
+        chunks = []
+        try:
+            async with self.semaphore or nullcontext():
+                async with self.async_client.messages.stream(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    system=_SYSTEM,
+                    messages=self._windowed_history()
+                ) as stream:
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+                        yield text
+        except GeneratorExit:
+            self.conversation_history.pop()
+            raise
+
+        self._record_reply("".join(chunks))
+
+    def _record_reply(self, assistant_message: str) -> Tuple[str, bool]:
+        """AI 응답을 기록하고 단계 완료 여부 갱신"""
         # 대화 히스토리에 AI 응답 추가
         self.conversation_history.append({
             "role": "assistant",
@@ -140,18 +288,13 @@ class Externalizer:
 
     def _has_enough_information(self) -> bool:
         """충분한 정보가 수집되었는지 확인"""
-        full_conversation = " ".join([
-            msg["content"] for msg in self.conversation_history
-        ])
-
-        # 표출화에서 찾아야 할 키워드들
-        keywords = [
-            "규칙", "패턴", "판단", "기준", "신호", "느낌",
-            "비유", "은유", "예외", "실수", "초보", "경험"
-        ]
-        found_keywords = sum(1 for kw in keywords if kw in full_conversation)
+        # 지난 확인 이후 추가된 메시지만 탐색해 키워드 누적
+        history = self.conversation_history
+        for msg in history[self._scanned_upto:]:
+            self._keyword_hits.update(_KEYWORD_RE.findall(msg["content"]))
+        self._scanned_upto = len(history)
 
-        return found_keywords >= 5
+        return len(self._keyword_hits) >= 5
 
     def generate_knowledge_spec(self) -> TacitKnowledgeSpec:
         """
@@ -160,72 +303,45 @@ class Externalizer:
         Returns:
             TacitKnowledgeSpec: 생성된 암묵지 명세서
         """
+        response_text = self._stream_output(self._build_spec_request())
+        result, response_text = self._validate_or_repair(response_text)
+        return self._apply_spec(result, response_text)
+
+    async def agenerate_knowledge_spec(self) -> TacitKnowledgeSpec:
+        """
+        암묵지 명세서 생성 (비동기)
+
+        Returns:
+            TacitKnowledgeSpec: 생성된 암묵지 명세서
+        """
+        response_text = await self._astream_output(self._build_spec_request())
+        result, response_text = await self._avalidate_or_repair(response_text)
+        return self._apply_spec(result, response_text)
+
+    def _build_spec_request(self) -> dict:
+        """암묵지 명세서 생성 요청 파라미터 구성"""
         # 암묵지 명세서 생성 프롬프트 추가
         messages = self.conversation_history + [{
             "role": "user",
             "content": EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT
         }]
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=3000,
-            system=EXTERNALIZER_SYSTEM_PROMPT,
-            messages=messages
-        )
-
-        # JSON 파싱
-        response_text = response.content[0].text
-        json_str = self._extract_json(response_text)
-
-        try:
-            data = json.loads(json_str)
-            self.knowledge_spec = TacitKnowledgeSpec(**data)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"JSON 파싱 오류: {e}")
-            self.knowledge_spec = self._create_fallback_spec(response_text)
-
+        return {
+            "model": self.model,
+            "max_tokens": 3000,
+            "system": _SYSTEM,
+            "messages": self._with_cache_breakpoint(messages),
+            **self.tool_params
+        }
+
+    def _apply_spec(self, result: Optional[TacitKnowledgeSpec], response_text: str) -> TacitKnowledgeSpec:
+        """검증 결과를 암묵지 명세서로 반영 (최종 실패 시 기본값)"""
+        self.knowledge_spec = result or self._create_fallback_spec(response_text)
         return self.knowledge_spec
 
-    def _extract_json(self, text: str) -> str:
-        """텍스트에서 JSON 블록 추출"""
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
-
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
-
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
-            return text[start:end]
-
-        return text
-
     def _create_fallback_spec(self, text: str) -> TacitKnowledgeSpec:
         """파싱 실패 시 기본 암묵지 명세서 생성"""
-        from models.knowledge import TransferDifficulty
-
-        return TacitKnowledgeSpec(
-            knowledge_name="추가 분석 필요",
-            summary="암묵지 명세서 생성을 위해 추가 분석이 필요합니다",
-            detailed_description="대화 내용을 바탕으로 암묵지 명세서를 생성하는 데 실패했습니다. "
-                                "추가 대화나 수동 분석이 필요합니다.",
-            trigger_signals=["미확인"],
-            decision_rules=["미확인"],
-            exceptions=["미확인"],
-            metaphor="미확인",
-            sensory_cues=[],
-            common_mistakes=[],
-            transfer_difficulty=TransferDifficulty.MEDIUM,
-            transfer_method="추가 분석 필요",
-            evidence_quotes=[]
-        )
+        return _FALLBACK_SPEC_TEMPLATE.model_copy()
 
     def get_conversation_summary(self) -> str:
         """대화 요약 반환"""
@@ -242,7 +358,3 @@ class Externalizer:
             summary_parts.append(f"{role}: {content}")
 
         return "\n".join(summary_parts)
-
-    def force_complete(self):
-        """강제로 단계 완료 처리"""
-        self.is_complete = True
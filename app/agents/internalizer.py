@@ -7,10 +7,11 @@ Converts business opportunities into actionable plans.
 Creates Action Plan as output.
 """
 
-import json
 from typing import Optional
-from anthropic import Anthropic
+import orjson
 
+from agents import _llm_cache
+from agents._base import BaseAgent, _CACHE_CONTROL
 from prompts.seci_prompts import (
     INTERNALIZER_SYSTEM_PROMPT,
     INTERNALIZER_ACTION_PLAN_PROMPT
@@ -25,7 +26,50 @@ from models.knowledge import (
 )
 
 
-class Internalizer:
+# 정적 프롬프트는 Anthropic 프롬프트 캐시로 재사용
+_SYSTEM = [{"type": "text", "text": INTERNALIZER_SYSTEM_PROMPT, "cache_control": _CACHE_CONTROL}]
+
+# 가변 데이터 블록의 고정 앞/뒤 부분 (요청마다 입력 JSON만 이어 붙임)
+_CARD_BLOCK_PREFIX = "다음은 연결화 단계에서 생성된 비즈니스 기회 카드입니다:\n\n```json\n"
+_CARD_BLOCK_SUFFIX = "\n```"
+
+# 파싱 실패 시 사용할 기본 액션플랜 (고정값이므로 검증 없이 한 번만 생성)
+# model_copy()는 얕은 복사이므로 하위 항목(dict)은 수정하지 않습니다.
+_FALLBACK_PLAN_TEMPLATE = ActionPlan.model_construct(
+    selected_opportunity="추가 분석 필요",
+    this_week_experiments=[
+        Experiment(
+            experiment_name="기본 실험",
+            description="액션플랜 생성을 위해 추가 분석이 필요합니다",
+            expected_outcome="미정",
+            success_criteria="미정",
+            time_required="미정",
+            resources_needed="미정"
+        )
+    ],
+    validation_metrics=[
+        ValidationMetric(
+            metric_name="기본 지표",
+            how_to_measure="추가 분석 필요",
+            target_value="미정"
+        )
+    ],
+    first_customer=FirstCustomer(
+        who="추가 분석 필요",
+        why_them="추가 분석 필요",
+        how_to_reach="추가 분석 필요"
+    ),
+    next_session_checklist=["액션플랜 재생성 시도"],
+    potential_obstacles=[
+        Obstacle(
+            obstacle="액션플랜 생성 실패",
+            mitigation="다시 시도해주세요"
+        )
+    ]
+)
+
+
+class Internalizer(BaseAgent):
     """
     내면화 촉진자 Agent - 내면화 단계를 담당
 
@@ -36,119 +80,105 @@ class Internalizer:
     - 피드백 루프 구축
     """
 
-    def __init__(self, client: Anthropic, model: str = "claude-sonnet-4-20250514"):
-        self.client = client
-        self.model = model
+    # 비대화형 단일 호출이므로 Message Batches API로 처리 가능
+    batch_eligible = True
+    output_model = ActionPlan
+    output_tool_name = "emit_action_plan"
+    output_tool_description = "추천된 비즈니스 기회에 대한 주간 액션플랜을 기록합니다."
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.business_card: Optional[BusinessOpportunityCard] = None
+        self._business_card_json: Optional[str] = None
         self.action_plan: Optional[ActionPlan] = None
-        self.is_complete = False
 
     def reset(self):
         """초기화"""
         self.business_card = None
+        self._business_card_json = None
         self.action_plan = None
         self.is_complete = False
 
     def set_business_card(self, business_card: BusinessOpportunityCard):
         """비즈니스 기회 카드 설정"""
         self.business_card = business_card
+        # 요청마다 다시 직렬화하지 않도록 프롬프트용 JSON을 미리 생성
+        self._business_card_json = orjson.dumps(
+            business_card.model_dump(), option=orjson.OPT_INDENT_2
+        ).decode()
 
-    def generate_action_plan(self) -> ActionPlan:
+    def generate_action_plan(self, no_cache: bool = False) -> ActionPlan:
         """
         주간 액션플랜 생성
 
+        Args:
+            no_cache: True면 응답 캐시를 무시하고 새로 생성
+
         Returns:
             ActionPlan: 생성된 액션플랜
         """
-        if not self.business_card:
-            raise ValueError("비즈니스 기회 카드가 설정되지 않았습니다.")
-
-        # 비즈니스 기회 카드를 프롬프트에 포함
-        business_card_json = self.business_card.model_dump_json(indent=2)
-
-        prompt = f"""다음은 연결화 단계에서 생성된 비즈니스 기회 카드입니다:
+        response_text, cache_key = self._cached_complete(self._build_request(), no_cache)
+        result, response_text = self._validate_or_repair(response_text)
+        return self._apply_result(result, response_text, cache_key)
 
-```json
-{business_card_json}
-```
+    async def agenerate_action_plan(self, no_cache: bool = False) -> ActionPlan:
+        """
+        주간 액션플랜 생성 (비동기)
 
-{INTERNALIZER_ACTION_PLAN_PROMPT}"""
+        async_client가 설정되어 있어야 합니다.
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=3000,
-            system=INTERNALIZER_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        Args:
+            no_cache: True면 응답 캐시를 무시하고 새로 생성
 
-        response_text = response.content[0].text
-        json_str = self._extract_json(response_text)
+        Returns:
+            ActionPlan: 생성된 액션플랜
+        """
+        response_text, cache_key = await self._acached_complete(self._build_request(), no_cache)
+        result, response_text = await self._avalidate_or_repair(response_text)
+        return self._apply_result(result, response_text, cache_key)
 
-        try:
-            data = json.loads(json_str)
-            self.action_plan = ActionPlan(**data)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"JSON 파싱 오류: {e}")
-            self.action_plan = self._create_fallback_plan()
+    def _build_request(self) -> dict:
+        """액션플랜 생성 요청 파라미터 구성"""
+        if not self.business_card:
+            raise ValueError("비즈니스 기회 카드가 설정되지 않았습니다.")
 
-        self.is_complete = True
-        return self.action_plan
+        # 비즈니스 기회 카드를 프롬프트에 포함 (set_business_card에서 직렬화해 둔 값)
+        business_card_json = self._business_card_json
 
-    def _extract_json(self, text: str) -> str:
-        """텍스트에서 JSON 블록 추출"""
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
+        # 정적 지시문(캐시 대상)을 먼저, 가변 데이터는 그 뒤에 배치
+        content = [
+            {"type": "text", "text": INTERNALIZER_ACTION_PLAN_PROMPT, "cache_control": _CACHE_CONTROL},
+            {"type": "text", "text": _CARD_BLOCK_PREFIX + business_card_json + _CARD_BLOCK_SUFFIX}
+        ]
 
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
+        return {
+            "model": self.model,
+            "max_tokens": 3000,
+            "system": _SYSTEM,
+            "messages": [{"role": "user", "content": content}],
+            **self.tool_params
+        }
+
+    def _apply_result(
+        self, result: Optional[ActionPlan], response_text: str, cache_key: Optional[str] = None
+    ) -> ActionPlan:
+        """
+        검증 결과를 액션플랜로 반영 (최종 실패 시 기본값)
 
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
-            return text[start:end]
+        검증에 성공한 응답(복구된 경우 복구된 JSON)만 cache_key로 캐시에 저장합니다.
+        """
+        if result is None:
+            result = self._create_fallback_plan()
+        elif cache_key:
+            _llm_cache.set(cache_key, response_text)
 
-        return text
+        self.action_plan = result
+        self.is_complete = True
+        return self.action_plan
 
     def _create_fallback_plan(self) -> ActionPlan:
         """파싱 실패 시 기본 액션플랜 생성"""
-        return ActionPlan(
-            selected_opportunity="추가 분석 필요",
-            this_week_experiments=[
-                Experiment(
-                    experiment_name="기본 실험",
-                    description="액션플랜 생성을 위해 추가 분석이 필요합니다",
-                    expected_outcome="미정",
-                    success_criteria="미정",
-                    time_required="미정",
-                    resources_needed="미정"
-                )
-            ],
-            validation_metrics=[
-                ValidationMetric(
-                    metric_name="기본 지표",
-                    how_to_measure="추가 분석 필요",
-                    target_value="미정"
-                )
-            ],
-            first_customer=FirstCustomer(
-                who="추가 분석 필요",
-                why_them="추가 분석 필요",
-                how_to_reach="추가 분석 필요"
-            ),
-            next_session_checklist=["액션플랜 재생성 시도"],
-            potential_obstacles=[
-                Obstacle(
-                    obstacle="액션플랜 생성 실패",
-                    mitigation="다시 시도해주세요"
-                )
-            ]
-        )
+        return _FALLBACK_PLAN_TEMPLATE.model_copy()
 
     def get_summary(self) -> str:
         """액션플랜 요약 반환"""
@@ -156,62 +186,43 @@ class Internalizer:
             return "액션플랜이 아직 생성되지 않았습니다."
 
         plan = self.action_plan
+        customer = plan.first_customer
+
+        sections = [f"## 선택된 비즈니스 기회\n{plan.selected_opportunity}\n\n## 이번 주 실험"]
+
+        sections.extend(
+            f"\n### 실험 {i}: {exp['experiment_name']}\n"
+            f"- 설명: {exp['description']}\n"
+            f"- 기대 결과: {exp['expected_outcome']}\n"
+            f"- 성공 기준: {exp['success_criteria']}\n"
+            f"- 소요 시간: {exp['time_required']}\n"
+            f"- 필요 자원: {exp['resources_needed']}"
+            for i, exp in enumerate(plan.this_week_experiments, 1)
+        )
 
-        summary_parts = [
-            f"## 선택된 비즈니스 기회",
-            f"{plan.selected_opportunity}",
-            "",
-            "## 이번 주 실험"
-        ]
+        sections.append("\n## 검증 지표")
+        sections.extend(
+            f"- **{metric['metric_name']}**\n"
+            f"  - 측정 방법: {metric['how_to_measure']}\n"
+            f"  - 목표: {metric['target_value']}"
+            for metric in plan.validation_metrics
+        )
 
-        for i, exp in enumerate(plan.this_week_experiments, 1):
-            summary_parts.extend([
-                f"\n### 실험 {i}: {exp.experiment_name}",
-                f"- 설명: {exp.description}",
-                f"- 기대 결과: {exp.expected_outcome}",
-                f"- 성공 기준: {exp.success_criteria}",
-                f"- 소요 시간: {exp.time_required}",
-                f"- 필요 자원: {exp.resources_needed}"
-            ])
-
-        summary_parts.extend([
-            "",
-            "## 검증 지표"
-        ])
-
-        for metric in plan.validation_metrics:
-            summary_parts.extend([
-                f"- **{metric.metric_name}**",
-                f"  - 측정 방법: {metric.how_to_measure}",
-                f"  - 목표: {metric.target_value}"
-            ])
-
-        summary_parts.extend([
-            "",
-            "## 첫 번째 고객",
-            f"- 누구: {plan.first_customer.who}",
-            f"- 이유: {plan.first_customer.why_them}",
-            f"- 접근 방법: {plan.first_customer.how_to_reach}",
-            "",
+        sections.append(
+            f"\n## 첫 번째 고객\n"
+            f"- 누구: {customer['who']}\n"
+            f"- 이유: {customer['why_them']}\n"
+            f"- 접근 방법: {customer['how_to_reach']}\n"
+            "\n"
             "## 다음 세션 체크리스트"
-        ])
-
-        for item in plan.next_session_checklist:
-            summary_parts.append(f"- [ ] {item}")
-
-        summary_parts.extend([
-            "",
-            "## 예상 장애물"
-        ])
-
-        for obs in plan.potential_obstacles:
-            summary_parts.extend([
-                f"- **{obs.obstacle}**",
-                f"  - 대응: {obs.mitigation}"
-            ])
+        )
+        sections.extend(f"- [ ] {item}" for item in plan.next_session_checklist)
 
-        return "\n".join(summary_parts)
+        sections.append("\n## 예상 장애물")
+        sections.extend(
+            f"- **{obs['obstacle']}**\n"
+            f"  - 대응: {obs['mitigation']}"
+            for obs in plan.potential_obstacles
+        )
 
-    def force_complete(self):
-        """강제로 단계 완료 처리"""
-        self.is_complete = True
+        return "\n".join(sections)
@@ -14,15 +14,16 @@ Each phase corresponds to a Ba (場):
 - Exercising Ba (I)
 """
 
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing
 from enum import Enum
-from typing import Optional, Dict, Any, Tuple
+from functools import cached_property, lru_cache
+from typing import Optional, Dict, Any, AsyncIterator, Generator, Iterator, Tuple
 from dataclasses import dataclass, field
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
-from agents.socializer import Socializer
-from agents.externalizer import Externalizer
-from agents.combiner import Combiner
-from agents.internalizer import Internalizer
+from agents.clients import create_async_client, create_client
 from models.knowledge import (
     ExperienceMap,
     TacitKnowledgeSpec,
@@ -31,7 +32,7 @@ from models.knowledge import (
 )
 
 
-class SECIPhase(str, Enum):
+class SECIPhase(Enum):
     """SECI 모델의 4단계"""
     SOCIALIZATION = "socialization"      # S: 사회화 (암묵지→암묵지)
     EXTERNALIZATION = "externalization"  # E: 표출화 (암묵지→형식지)
@@ -63,6 +64,62 @@ BA_DESCRIPTIONS = {
     Ba.EXERCISING: "실천의 장 (Exercising Ba) - 실행과 체화의 공간",
 }
 
+# 단계별 표시 이름과 설명
+PHASE_NAMES = {
+    SECIPhase.SOCIALIZATION: "사회화 (Socialization)",
+    SECIPhase.EXTERNALIZATION: "표출화 (Externalization)",
+    SECIPhase.COMBINATION: "연결화 (Combination)",
+    SECIPhase.INTERNALIZATION: "내면화 (Internalization)",
+    SECIPhase.COMPLETE: "완료",
+}
+
+PHASE_DESCRIPTIONS = {
+    SECIPhase.SOCIALIZATION: "암묵지 → 암묵지: 경험과 감정을 공유하며 암묵지가 숨어있는 영역을 탐색합니다.",
+    SECIPhase.EXTERNALIZATION: "암묵지 → 형식지: 소크라테스식 대화로 암묵지를 언어화합니다.",
+    SECIPhase.COMBINATION: "형식지 → 형식지: 표출된 지식을 비즈니스 기회와 연결합니다.",
+    SECIPhase.INTERNALIZATION: "형식지 → 암묵지: 지식을 실행 가능한 액션플랜으로 전환합니다.",
+    SECIPhase.COMPLETE: "SECI 나선이 완료되었습니다.",
+}
+
+# 첫 화면 환영 메시지
+WELCOME_MESSAGE = """안녕하세요! **Tacit** 서비스에 오신 것을 환영합니다.
+
+저는 당신의 **암묵지(Tacit Knowledge)**를 발견하고,
+비즈니스 기회로 연결해드리는 AI 파트너입니다.
+
+> *"We can know more than we can tell"*
+> — Michael Polanyi
+
+지금부터 **SECI 지식창조 나선**을 시작합니다.
+
+**첫 번째 단계: 사회화 (Socialization)**
+창발의 장(Originating Ba)에서 당신의 경험을 탐색합니다.
+
+먼저 간단히 자기소개를 부탁드릴게요.
+**어떤 일을 하시고, 얼마나 오래 하셨나요?**"""
+
+# 비동기 API 동시 호출 수 제한 (rate limit 대응)
+MAX_CONCURRENT_REQUESTS = 4
+
+# 산출물 필드 (생성 순서)
+OUTPUT_FIELDS = ("experience_map", "knowledge_spec", "business_card", "action_plan")
+
+# 지연 생성되는 Agent 속성 이름 (reset 시 함께 비움)
+_AGENT_NAMES = ("socializer", "externalizer", "combiner", "internalizer")
+
+
+# 단계/Ba 조회는 화면을 그릴 때마다 반복되므로 값별로 메모이즈
+@lru_cache(maxsize=8)
+def _ba_for(phase: SECIPhase) -> Ba:
+    """단계에 해당하는 Ba"""
+    return PHASE_TO_BA.get(phase, Ba.ORIGINATING)
+
+
+@lru_cache(maxsize=8)
+def _ba_desc(ba: Ba) -> str:
+    """Ba 설명"""
+    return BA_DESCRIPTIONS.get(ba, "")
+
 
 @dataclass
 class SECIState:
@@ -79,6 +136,36 @@ class SECIState:
     # 대화 기록
     conversation_history: Dict[SECIPhase, list] = field(default_factory=dict)
 
+    # 단계 결과 메시지 캐시 (산출물이 바뀌지 않는 한 재사용)
+    _formatted_combination: Optional[str] = field(default=None, repr=False)
+    _formatted_internalization: Optional[str] = field(default=None, repr=False)
+
+    # 산출물 직렬화 캐시: 필드 이름 -> (산출물, dict, JSON 문자열)
+    # 같은 객체가 그대로 있는 동안 재사용하고, 새 산출물이 대입되면 다시 직렬화
+    _serialized: Dict[str, Tuple[Any, Dict[str, Any], str]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def serialized(self, name: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        산출물의 (dict, JSON 문자열) 반환
+
+        Args:
+            name: 산출물 필드 이름 (OUTPUT_FIELDS 참고)
+
+        Returns:
+            Optional[Tuple[Dict, str]]: 산출물이 없으면 None
+        """
+        output = getattr(self, name)
+        if not output:
+            return None
+
+        cached = self._serialized.get(name)
+        if cached is None or cached[0] is not output:
+            cached = (output, output.model_dump(), output.model_dump_json(indent=2))
+            self._serialized[name] = cached
+        return cached[1], cached[2]
+
 
 class SECIOrchestrator:
     """
@@ -88,26 +175,76 @@ class SECIOrchestrator:
     각 단계의 Agent를 조율합니다.
     """
 
-    def __init__(self, api_key: str, model: str = "claude-haiku-4-5-20251001"):
-        self.client = Anthropic(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-haiku-4-5-20251001",
+        client: Optional[Anthropic] = None,
+        async_client: Optional[AsyncAnthropic] = None
+    ):
+        # 전달받은 클라이언트가 있으면 재사용해 연결 풀을 유지
+        self.client = client or create_client(api_key)
+        self.async_client = async_client or create_async_client(api_key)
         self.model = model
 
-        # Agent 초기화
-        self.socializer = Socializer(self.client, model)
-        self.externalizer = Externalizer(self.client, model)
-        self.combiner = Combiner(self.client, model)
-        self.internalizer = Internalizer(self.client, model)
+        # 모든 Agent가 공유하는 비동기 호출 제한
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
         # 상태 초기화
         self.state = SECIState()
+        self.last_chat_info: Dict[str, Any] = self.get_phase_info()
+
+        # 단계 전환 직후 다음 단계의 첫 호출을 미리 실행 (사용자가 결과를 읽는 동안)
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._prefetch: Optional[Tuple[SECIPhase, Future]] = None
+
+        # 단계별 대화 처리기 (COMPLETE는 chat_stream에서 바로 처리)
+        self._chat_handlers = {
+            SECIPhase.SOCIALIZATION: self._chat_socialization,
+            SECIPhase.EXTERNALIZATION: self._chat_externalization,
+            SECIPhase.COMBINATION: self._chat_combination,
+            SECIPhase.INTERNALIZATION: self._chat_internalization,
+        }
+        self._achat_handlers = {
+            SECIPhase.SOCIALIZATION: self._achat_socialization,
+            SECIPhase.EXTERNALIZATION: self._achat_externalization,
+            SECIPhase.COMBINATION: self._achat_combination,
+            SECIPhase.INTERNALIZATION: self._achat_internalization,
+        }
 
     def reset(self):
         """전체 초기화"""
+        self._discard_prefetch()
         self.state = SECIState()
-        self.socializer.reset()
-        self.externalizer.reset()
-        self.combiner.reset()
-        self.internalizer.reset()
+        self.last_chat_info = self.get_phase_info()
+        # 생성된 Agent를 버리고 다음 사용 시 새로 생성
+        for name in _AGENT_NAMES:
+            self.__dict__.pop(name, None)
+
+    # Agent는 처음 사용할 때 생성 (대부분의 세션은 뒤 단계까지 가지 않음)
+    @cached_property
+    def socializer(self):
+        """공감자 Agent (사회화)"""
+        from agents.socializer import Socializer
+        return Socializer(self.client, self.model, self.async_client, self.semaphore)
+
+    @cached_property
+    def externalizer(self):
+        """표출자 Agent (표출화)"""
+        from agents.externalizer import Externalizer
+        return Externalizer(self.client, self.model, self.async_client, self.semaphore)
+
+    @cached_property
+    def combiner(self):
+        """연결자 Agent (연결화)"""
+        from agents.combiner import Combiner
+        return Combiner(self.client, self.model, self.async_client, self.semaphore)
+
+    @cached_property
+    def internalizer(self):
+        """내면화 촉진자 Agent (내면화)"""
+        from agents.internalizer import Internalizer
+        return Internalizer(self.client, self.model, self.async_client, self.semaphore)
 
     @property
     def current_phase(self) -> SECIPhase:
@@ -117,35 +254,19 @@ class SECIOrchestrator:
     @property
     def current_ba(self) -> Ba:
         """현재 Ba(場)"""
-        return PHASE_TO_BA.get(self.state.phase, Ba.ORIGINATING)
+        return _ba_for(self.state.phase)
 
     @property
     def current_ba_description(self) -> str:
         """현재 Ba 설명"""
-        return BA_DESCRIPTIONS.get(self.current_ba, "")
+        return _ba_desc(self.current_ba)
 
     def get_phase_info(self) -> Dict[str, Any]:
         """현재 단계 정보 반환"""
-        phase_names = {
-            SECIPhase.SOCIALIZATION: "사회화 (Socialization)",
-            SECIPhase.EXTERNALIZATION: "표출화 (Externalization)",
-            SECIPhase.COMBINATION: "연결화 (Combination)",
-            SECIPhase.INTERNALIZATION: "내면화 (Internalization)",
-            SECIPhase.COMPLETE: "완료",
-        }
-
-        phase_descriptions = {
-            SECIPhase.SOCIALIZATION: "암묵지 → 암묵지: 경험과 감정을 공유하며 암묵지가 숨어있는 영역을 탐색합니다.",
-            SECIPhase.EXTERNALIZATION: "암묵지 → 형식지: 소크라테스식 대화로 암묵지를 언어화합니다.",
-            SECIPhase.COMBINATION: "형식지 → 형식지: 표출된 지식을 비즈니스 기회와 연결합니다.",
-            SECIPhase.INTERNALIZATION: "형식지 → 암묵지: 지식을 실행 가능한 액션플랜으로 전환합니다.",
-            SECIPhase.COMPLETE: "SECI 나선이 완료되었습니다.",
-        }
-
         return {
             "phase": self.state.phase.value,
-            "phase_name": phase_names[self.state.phase],
-            "phase_description": phase_descriptions[self.state.phase],
+            "phase_name": PHASE_NAMES[self.state.phase],
+            "phase_description": PHASE_DESCRIPTIONS[self.state.phase],
             "ba": self.current_ba.value,
             "ba_description": self.current_ba_description,
             "spiral_count": self.state.spiral_count,
@@ -161,59 +282,282 @@ class SECIOrchestrator:
         Returns:
             Tuple[str, Dict]: (AI 응답, 상태 정보)
         """
-        response = ""
+        response = "".join(self.chat_stream(user_message))
+        return response, self.last_chat_info
+
+    def chat_stream(self, user_message: str) -> Iterator[str]:
+        """
+        사용자 메시지 처리 (스트리밍)
+
+        현재 단계 Agent의 응답을 생성되는 대로 yield합니다.
+        스트림이 끝나면 단계 전환을 처리하고 상태 정보를 last_chat_info에 저장합니다.
+
+        Args:
+            user_message: 사용자 메시지
+
+        Yields:
+            str: AI 응답 조각
+        """
+        # 나선이 끝났으면 마지막 결과 메시지를 그대로 반환
+        phase = self.state.phase
+        if phase is SECIPhase.COMPLETE:
+            self.last_chat_info = {**self.get_phase_info(), "phase_changed": False}
+            yield self._format_internalization_result()
+            return
+
+        prefetched = self._take_prefetch()
+        handler = self._chat_handlers[phase]
+        phase_changed = yield from handler(user_message, prefetched)
+
+        if phase_changed:
+            self._start_prefetch()
+
+        info = self.get_phase_info()
+        info["phase_changed"] = phase_changed
+        self.last_chat_info = info
+
+    def _chat_socialization(self, user_message: str, prefetched: Any) -> Generator[str, None, bool]:
+        """사회화 단계 대화 (단계가 바뀌면 True 반환)"""
+        yield from self.socializer.chat_stream(user_message)
+
+        if not self.socializer.is_complete:
+            return False
+
+        # 경험 지도 생성 후 다음 단계로 (응답과 함께 받았으면 재사용)
+        self.state.experience_map = (
+            self.socializer.experience_map
+            or self.socializer.generate_experience_map()
+        )
+        self._advance_phase()
+        return True
+
+    def _chat_externalization(self, user_message: str, prefetched: Any) -> Generator[str, None, bool]:
+        """표출화 단계 대화 (단계가 바뀌면 True 반환)"""
+        # 첫 대화라면 초기 메시지 생성 (미리 생성해 둔 것이 있으면 사용)
+        if prefetched is not None or not self.externalizer.conversation_history:
+            if prefetched is None:
+                prefetched = self._initial_message(self.state.experience_map)
+            yield prefetched
+            return False
+
+        yield from self.externalizer.chat_stream(user_message)
+
+        if not self.externalizer.is_complete:
+            return False
+
+        # 암묵지 명세서 생성 후 다음 단계로
+        self.state.knowledge_spec = self.externalizer.generate_knowledge_spec()
+        self._advance_phase()
+        return True
+
+    def _chat_combination(self, user_message: str, prefetched: Any) -> Generator[str, None, bool]:
+        """연결화 단계: 비즈니스 기회 카드 생성 (단계가 바뀌면 True 반환)"""
         phase_changed = False
+        if prefetched is not None or not self.combiner.business_card:
+            if prefetched is None:
+                prefetched = self._business_card(self.state.knowledge_spec)
+            self.state.business_card = prefetched
+            self._advance_phase()
+            phase_changed = True
+
+        yield self._format_combination_result()
+        return phase_changed
+
+    def _chat_internalization(self, user_message: str, prefetched: Any) -> Generator[str, None, bool]:
+        """내면화 단계: 액션플랜 생성 (단계가 바뀌면 True 반환)"""
+        phase_changed = False
+        if prefetched is not None or not self.internalizer.action_plan:
+            if prefetched is None:
+                prefetched = self._action_plan(self.state.business_card)
+            self.state.action_plan = prefetched
+            self._advance_phase()
+            phase_changed = True
+
+        # 완료 단계에서 재사용할 결과 메시지도 여기서 한 번 생성
+        yield self._format_internalization_result()
+        return phase_changed
+
+    async def achat(self, user_message: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        사용자 메시지 처리 (비동기)
 
-        if self.state.phase == SECIPhase.SOCIALIZATION:
-            response, is_complete = self.socializer.chat(user_message)
+        Args:
+            user_message: 사용자 메시지
 
-            if is_complete:
-                # 경험 지도 생성 후 다음 단계로
-                self.state.experience_map = self.socializer.generate_experience_map()
-                self._advance_phase()
-                phase_changed = True
+        Returns:
+            Tuple[str, Dict]: (AI 응답, 상태 정보)
+        """
+        chunks = [text async for text in self.achat_stream(user_message)]
+        return "".join(chunks), self.last_chat_info
 
-        elif self.state.phase == SECIPhase.EXTERNALIZATION:
-            # 첫 대화라면 초기 메시지 생성
-            if not self.externalizer.conversation_history:
-                self.externalizer.set_experience_map(self.state.experience_map)
-                initial = self.externalizer.get_initial_message()
-                return initial, self.get_phase_info()
+    async def achat_stream(self, user_message: str) -> AsyncIterator[str]:
+        """
+        사용자 메시지 처리 (비동기 스트리밍)
 
-            response, is_complete = self.externalizer.chat(user_message)
+        chat_stream과 같지만 Agent의 비동기 API를 사용해, 응답을 기다리는 동안
+        이벤트 루프가 다른 작업을 진행할 수 있습니다.
 
-            if is_complete:
-                # 암묵지 명세서 생성 후 다음 단계로
-                self.state.knowledge_spec = self.externalizer.generate_knowledge_spec()
-                self._advance_phase()
-                phase_changed = True
+        Args:
+            user_message: 사용자 메시지
 
-        elif self.state.phase == SECIPhase.COMBINATION:
-            # 연결화 단계: 비즈니스 기회 카드 생성
-            if not self.combiner.business_card:
-                self.combiner.set_knowledge_spec(self.state.knowledge_spec)
-                self.state.business_card = self.combiner.generate_business_card()
-                response = self._format_combination_result()
-                self._advance_phase()
-                phase_changed = True
-            else:
-                response = self._format_combination_result()
-
-        elif self.state.phase == SECIPhase.INTERNALIZATION:
-            # 내면화 단계: 액션플랜 생성
-            if not self.internalizer.action_plan:
-                self.internalizer.set_business_card(self.state.business_card)
-                self.state.action_plan = self.internalizer.generate_action_plan()
-                response = self._format_internalization_result()
-                self._advance_phase()
-                phase_changed = True
-            else:
-                response = self._format_internalization_result()
+        Yields:
+            str: AI 응답 조각
+        """
+        phase = self.state.phase
+        if phase is SECIPhase.COMPLETE:
+            self.last_chat_info = {**self.get_phase_info(), "phase_changed": False}
+            yield self._format_internalization_result()
+            return
+
+        prefetched = await self._atake_prefetch()
+        # async for는 중단 시 내부 제너레이터를 닫지 않으므로 aclosing으로 바로 닫아
+        # Agent의 중단 처리(사용자 메시지 되돌리기)가 이번 턴 안에서 실행되게 함
+        async with aclosing(self._achat_handlers[phase](user_message, prefetched)) as stream:
+            async for text in stream:
+                yield text
+
+        # 비동기 제너레이터는 값을 반환할 수 없으므로 단계 비교로 전환 여부 판단
+        phase_changed = self.state.phase != phase
+        if phase_changed:
+            self._start_prefetch()
 
         info = self.get_phase_info()
         info["phase_changed"] = phase_changed
+        self.last_chat_info = info
+
+    async def _achat_socialization(self, user_message: str, prefetched: Any) -> AsyncIterator[str]:
+        """사회화 단계 대화 (비동기)"""
+        async with aclosing(self.socializer.achat_stream(user_message)) as stream:
+            async for text in stream:
+                yield text
+
+        if self.socializer.is_complete:
+            self.state.experience_map = (
+                self.socializer.experience_map
+                or await self.socializer.agenerate_experience_map()
+            )
+            self._advance_phase()
+
+    async def _achat_externalization(self, user_message: str, prefetched: Any) -> AsyncIterator[str]:
+        """표출화 단계 대화 (비동기)"""
+        if prefetched is not None or not self.externalizer.conversation_history:
+            if prefetched is None:
+                self.externalizer.set_experience_map(self.state.experience_map)
+                prefetched = await self.externalizer.aget_initial_message()
+            yield prefetched
+            return
+
+        async with aclosing(self.externalizer.achat_stream(user_message)) as stream:
+            async for text in stream:
+                yield text
+
+        if self.externalizer.is_complete:
+            self.state.knowledge_spec = await self.externalizer.agenerate_knowledge_spec()
+            self._advance_phase()
+
+    async def _achat_combination(self, user_message: str, prefetched: Any) -> AsyncIterator[str]:
+        """연결화 단계: 비즈니스 기회 카드 생성 (비동기)"""
+        if prefetched is not None or not self.combiner.business_card:
+            if prefetched is None:
+                self.combiner.set_knowledge_spec(self.state.knowledge_spec)
+                prefetched = await self.combiner.agenerate_business_card()
+            self.state.business_card = prefetched
+            self._advance_phase()
+
+        yield self._format_combination_result()
+
+    async def _achat_internalization(self, user_message: str, prefetched: Any) -> AsyncIterator[str]:
+        """내면화 단계: 액션플랜 생성 (비동기)"""
+        if prefetched is not None or not self.internalizer.action_plan:
+            if prefetched is None:
+                self.internalizer.set_business_card(self.state.business_card)
+                prefetched = await self.internalizer.agenerate_action_plan()
+            self.state.action_plan = prefetched
+            self._advance_phase()
+
+        yield self._format_internalization_result()
+
+    def _initial_message(self, experience_map: ExperienceMap) -> str:
+        """표출화 단계 초기 메시지 생성"""
+        self.externalizer.set_experience_map(experience_map)
+        return self.externalizer.get_initial_message()
+
+    def _business_card(self, knowledge_spec: TacitKnowledgeSpec) -> BusinessOpportunityCard:
+        """비즈니스 기회 카드 생성"""
+        self.combiner.set_knowledge_spec(knowledge_spec)
+        return self.combiner.generate_business_card()
+
+    def _action_plan(self, business_card: BusinessOpportunityCard) -> ActionPlan:
+        """액션플랜 생성"""
+        self.internalizer.set_business_card(business_card)
+        return self.internalizer.generate_action_plan()
+
+    def _start_prefetch(self):
+        """새 단계의 첫 호출을 백그라운드에서 미리 실행"""
+        phase = self.state.phase
+        match phase:
+            case SECIPhase.EXTERNALIZATION:
+                task, arg = self._initial_message, self.state.experience_map
+            case SECIPhase.COMBINATION:
+                task, arg = self._business_card, self.state.knowledge_spec
+            case SECIPhase.INTERNALIZATION:
+                task, arg = self._action_plan, self.state.business_card
+            case _:
+                return
+
+        if arg is not None:
+            self._prefetch = (phase, self._executor.submit(task, arg))
+
+    def _take_prefetch(self) -> Optional[Any]:
+        """
+        미리 실행한 결과 가져오기
 
-        return response, info
+        아직 실행 중이면 끝날 때까지 기다립니다 (같은 Agent를 동시에 호출하지 않도록).
+
+        Returns:
+            현재 단계용 결과 또는 None (없거나, 다른 단계용이거나, 실패한 경우)
+        """
+        if self._prefetch is None:
+            return None
+
+        phase, future = self._prefetch
+        self._prefetch = None
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"사전 실행 오류: {e}")
+            return None
+
+        return result if phase == self.state.phase else None
+
+    async def _atake_prefetch(self) -> Optional[Any]:
+        """미리 실행한 결과 가져오기 (비동기 - 기다리는 동안 이벤트 루프를 막지 않음)"""
+        if self._prefetch is None:
+            return None
+
+        phase, future = self._prefetch
+        self._prefetch = None
+        try:
+            result = await asyncio.wrap_future(future)
+        except Exception as e:
+            print(f"사전 실행 오류: {e}")
+            return None
+
+        return result if phase == self.state.phase else None
+
+    def _discard_prefetch(self):
+        """미리 실행 중인 호출 취소 (이미 실행 중이면 끝날 때까지 대기)"""
+        if self._prefetch is None:
+            return
+
+        _, future = self._prefetch
+        self._prefetch = None
+        if not future.cancel():
+            # 실행 중인 호출이 초기화된 Agent 상태를 덮어쓰지 않도록 대기
+            try:
+                future.result()
+            except Exception:
+                pass
 
     def _advance_phase(self):
         """다음 단계로 진행"""
@@ -231,31 +575,84 @@ class SECIOrchestrator:
 
     def force_advance_phase(self):
         """강제로 다음 단계로 진행 (테스트/디버그용)"""
-        if self.state.phase == SECIPhase.SOCIALIZATION:
-            self.socializer.force_complete()
-            self.state.experience_map = self.socializer.generate_experience_map()
+        # 현재 단계용으로 미리 실행한 결과가 있으면 다시 생성하지 않고 사용
+        prefetched = self._take_prefetch()
 
-        elif self.state.phase == SECIPhase.EXTERNALIZATION:
-            self.externalizer.force_complete()
-            self.state.knowledge_spec = self.externalizer.generate_knowledge_spec()
+        match self.state.phase:
+            case SECIPhase.SOCIALIZATION:
+                self.socializer.force_complete()
+                self.state.experience_map = self.socializer.generate_experience_map()
 
-        elif self.state.phase == SECIPhase.COMBINATION:
-            if self.state.knowledge_spec:
-                self.combiner.set_knowledge_spec(self.state.knowledge_spec)
-                self.state.business_card = self.combiner.generate_business_card()
+            case SECIPhase.EXTERNALIZATION:
+                self.externalizer.force_complete()
+                self.state.knowledge_spec = self.externalizer.generate_knowledge_spec()
 
-        elif self.state.phase == SECIPhase.INTERNALIZATION:
-            if self.state.business_card:
-                self.internalizer.set_business_card(self.state.business_card)
-                self.state.action_plan = self.internalizer.generate_action_plan()
+            case SECIPhase.COMBINATION if self.state.knowledge_spec:
+                if prefetched is None:
+                    prefetched = self._business_card(self.state.knowledge_spec)
+                self.state.business_card = prefetched
+                self.state._formatted_combination = None
+
+            case SECIPhase.INTERNALIZATION if self.state.business_card:
+                if prefetched is None:
+                    prefetched = self._action_plan(self.state.business_card)
+                self.state.action_plan = prefetched
+                self.state._formatted_internalization = None
 
         self._advance_phase()
 
+    def fast_forward_to_complete(self):
+        """
+        남은 단계를 한 번에 끝까지 진행 (테스트/디버그용)
+
+        액션플랜은 비즈니스 기회 카드에 의존하므로 생성 자체는 순서대로 하되,
+        액션플랜 호출을 백그라운드로 보내고 그동안 연결화 결과 메시지를 만들어 둡니다.
+        """
+        # 미리 실행 중인 호출은 같은 Agent를 동시에 부르지 않도록 먼저 회수
+        # (현재 단계용 결과면 다시 생성하지 않고 사용)
+        phase = self.state.phase
+        prefetched = self._take_prefetch()
+
+        # 대화 단계는 기존 강제 진행을 그대로 사용
+        while self.state.phase in (SECIPhase.SOCIALIZATION, SECIPhase.EXTERNALIZATION):
+            self.force_advance_phase()
+
+        if self.state.phase == SECIPhase.COMBINATION:
+            if self.state.knowledge_spec:
+                card = prefetched if phase is SECIPhase.COMBINATION else None
+                if card is None:
+                    card = self._business_card(self.state.knowledge_spec)
+                self.state.business_card = card
+                self.state._formatted_combination = None
+            self._advance_phase()
+
+        if self.state.phase == SECIPhase.INTERNALIZATION:
+            plan = prefetched if phase is SECIPhase.INTERNALIZATION else None
+            future = None
+            if plan is None and self.state.business_card:
+                future = self._executor.submit(self._action_plan, self.state.business_card)
+
+            # LLM 응답을 기다리는 동안 연결화 결과 메시지를 미리 포맷
+            self._format_combination_result()
+
+            if future is not None:
+                plan = future.result()
+            if plan is not None:
+                self.state.action_plan = plan
+                self.state._formatted_internalization = None
+            self._advance_phase()
+
     def _format_combination_result(self) -> str:
         """연결화 단계 결과 포맷팅"""
         if not self.state.business_card:
             return "비즈니스 기회 카드가 생성되지 않았습니다."
 
+        if self.state._formatted_combination is None:
+            self.state._formatted_combination = self._build_combination_result()
+        return self.state._formatted_combination
+
+    def _build_combination_result(self) -> str:
+        """연결화 단계 결과 메시지 생성"""
         return f"""## 🔗 연결화 단계 완료!
 
 시스템화의 장(Systemising Ba)에서 당신의 암묵지를 비즈니스 기회와 연결했습니다.
@@ -274,6 +671,12 @@ class SECIOrchestrator:
         if not self.state.action_plan:
             return "액션플랜이 생성되지 않았습니다."
 
+        if self.state._formatted_internalization is None:
+            self.state._formatted_internalization = self._build_internalization_result()
+        return self.state._formatted_internalization
+
+    def _build_internalization_result(self) -> str:
+        """내면화 단계 결과 메시지 생성"""
         return f"""## 🎯 내면화 단계 완료!
 
 실천의 장(Exercising Ba)에서 실행 가능한 액션플랜을 만들었습니다.
@@ -298,48 +701,35 @@ class SECIOrchestrator:
 
     def get_current_output(self) -> Optional[Any]:
         """현재 단계의 산출물 반환"""
-        if self.state.phase == SECIPhase.EXTERNALIZATION:
-            return self.state.experience_map
-        elif self.state.phase == SECIPhase.COMBINATION:
-            return self.state.knowledge_spec
-        elif self.state.phase == SECIPhase.INTERNALIZATION:
-            return self.state.business_card
-        elif self.state.phase == SECIPhase.COMPLETE:
-            return self.state.action_plan
+        match self.state.phase:
+            case SECIPhase.EXTERNALIZATION:
+                return self.state.experience_map
+            case SECIPhase.COMBINATION:
+                return self.state.knowledge_spec
+            case SECIPhase.INTERNALIZATION:
+                return self.state.business_card
+            case SECIPhase.COMPLETE:
+                return self.state.action_plan
         return None
 
     def get_all_outputs(self) -> Dict[str, Any]:
         """모든 산출물 반환"""
         outputs = {}
+        for name in OUTPUT_FIELDS:
+            serialized = self.state.serialized(name)
+            if serialized:
+                outputs[name] = serialized[0]
+        return outputs
 
-        if self.state.experience_map:
-            outputs["experience_map"] = self.state.experience_map.model_dump()
-
-        if self.state.knowledge_spec:
-            outputs["knowledge_spec"] = self.state.knowledge_spec.model_dump()
-
-        if self.state.business_card:
-            outputs["business_card"] = self.state.business_card.model_dump()
-
-        if self.state.action_plan:
-            outputs["action_plan"] = self.state.action_plan.model_dump()
-
+    def get_all_outputs_json(self) -> Dict[str, str]:
+        """모든 산출물을 JSON 문자열로 반환 (st.json에 바로 전달)"""
+        outputs = {}
+        for name in OUTPUT_FIELDS:
+            serialized = self.state.serialized(name)
+            if serialized:
+                outputs[name] = serialized[1]
         return outputs
 
     def get_welcome_message(self) -> str:
         """환영 메시지"""
-        return """안녕하세요! **Tacit** 서비스에 오신 것을 환영합니다.
-
-저는 당신의 **암묵지(Tacit Knowledge)**를 발견하고,
-비즈니스 기회로 연결해드리는 AI 파트너입니다.
-
-> *"We can know more than we can tell"*
-> — Michael Polanyi
-
-지금부터 **SECI 지식창조 나선**을 시작합니다.
-
-**첫 번째 단계: 사회화 (Socialization)**
-창발의 장(Originating Ba)에서 당신의 경험을 탐색합니다.
-
-먼저 간단히 자기소개를 부탁드릴게요.
-**어떤 일을 하시고, 얼마나 오래 하셨나요?**"""
+        return WELCOME_MESSAGE
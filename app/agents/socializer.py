@@ -7,18 +7,68 @@ Builds rapport with the user and explores areas where tacit knowledge
 might be hidden. Creates an Experience Map as output.
 """
 
-import json
-from typing import List, Optional, Tuple
-from anthropic import Anthropic
+import re
+from contextlib import nullcontext
+from typing import AsyncIterator, Iterator, List, Optional, Set, Tuple
+from pydantic import ValidationError
 
+from agents._base import BaseAgent, _CACHE_CONTROL
+from agents._semantic_cache import SemanticCache
 from prompts.seci_prompts import (
     SOCIALIZER_SYSTEM_PROMPT,
-    SOCIALIZER_EXPERIENCE_MAP_PROMPT
+    SOCIALIZER_EXPERIENCE_MAP_PROMPT,
+    SOCIALIZER_INLINE_MAP_PROMPT,
+    SOCIALIZER_SUMMARY_PROMPT
 )
-from models.knowledge import ExperienceMap
+from models.knowledge import (
+    ExperienceMap,
+    UserProfile,
+    TacitKnowledgeCandidate,
+    EmotionalWeight
+)
+
+
+# 정적 프롬프트는 Anthropic 프롬프트 캐시로 재사용
+_SYSTEM = [{"type": "text", "text": SOCIALIZER_SYSTEM_PROMPT, "cache_control": _CACHE_CONTROL}]
+
+# 사회화에서 찾아야 할 키워드들 (한 번의 탐색으로 모두 매칭)
+KEYWORDS = ("직업", "일", "경험", "노하우", "잘하", "자부심", "후배", "동료")
+_KEYWORD_RE = re.compile("|".join(map(re.escape, KEYWORDS)))
+
+# 마지막 턴에 응답과 함께 받는 경험 지도 태그
+_MAP_OPEN = "<MAP>"
+_MAP_CLOSE = "</MAP>"
 
+# 응답 토큰 예산: 공감형 답변은 짧게, 경험 지도 JSON은 기존대로 2천 토큰
+# (한국어 후보 영역이 여러 개면 1.5천 토큰을 넘길 수 있음)
+CHAT_MAX_TOKENS = 768
+MAP_MAX_TOKENS = 2048
+# 경험 지도 JSON 블록이 끝나면 바로 중단
+_MAP_STOP_SEQUENCES = ["```\n\n", _MAP_CLOSE]
+
+# 비슷한 자기소개/대화에서 나온 경험 지도 재사용 (TACIT_SEMANTIC_CACHE=1일 때만)
+_MAP_CACHE = SemanticCache("experience_map")
+
+
+def _hold_map_prefix(text: str) -> Tuple[str, Optional[str]]:
+    """
+    스트리밍 중 화면에 보낼 부분과 보류할 부분 분리
 
-class Socializer:
+    Returns:
+        Tuple[str, Optional[str]]: (보낼 텍스트, 보류할 텍스트 - <MAP>이 시작되면 None)
+    """
+    index = text.find(_MAP_OPEN)
+    if index >= 0:
+        return text[:index].rstrip(), None
+
+    # 조각 경계에 걸친 "<MA" 같은 태그 앞부분은 다음 조각까지 보류
+    for size in range(min(len(_MAP_OPEN) - 1, len(text)), 0, -1):
+        if text.endswith(_MAP_OPEN[:size]):
+            return text[:-size], text[-size:]
+    return text, ""
+
+
+class Socializer(BaseAgent):
     """
     공감자 Agent - 사회화 단계를 담당
 
@@ -28,18 +78,44 @@ class Socializer:
     - 경험 지도(Experience Map) 생성
     """
 
-    def __init__(self, client: Anthropic, model: str = "claude-sonnet-4-20250514"):
-        self.client = client
-        self.model = model
-        self.conversation_history: List[dict] = []
-        self.is_complete = False
+    # 대화 압축: 최근 턴만 그대로 보내고 이전 대화는 요약으로 대체
+    speaker_label = "공감자"
+    summary_prompt = SOCIALIZER_SUMMARY_PROMPT
+
+    def __init__(self, *args, max_tokens: int = CHAT_MAX_TOKENS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_tokens = max_tokens
+        # 대화 기록은 역할/내용 병렬 리스트로 보관 (메시지 dict는 API 호출 때만 생성)
+        self._roles: List[str] = []
+        self._contents: List[str] = []
         self.experience_map: Optional[ExperienceMap] = None
+        # 키워드 탐색은 _contents[_scanned_upto:]만 새로 훑음
+        self._keyword_hits: Set[str] = set()
+        self._scanned_upto = 0
 
     def reset(self):
         """대화 초기화"""
-        self.conversation_history = []
+        self._roles = []
+        self._contents = []
         self.is_complete = False
         self.experience_map = None
+        self._keyword_hits = set()
+        self._scanned_upto = 0
+        self._summary = ""
+        self._summarized_until = 0
+
+    @property
+    def conversation_history(self) -> List[dict]:
+        """API 형식의 대화 기록 (호출할 때마다 새로 생성)"""
+        return [
+            {"role": role, "content": content}
+            for role, content in zip(self._roles, self._contents)
+        ]
+
+    def _add_message(self, role: str, content: str):
+        """대화 기록에 메시지 추가"""
+        self._roles.append(role)
+        self._contents.append(content)
 
     def chat(self, user_message: str) -> Tuple[str, bool]:
         """
@@ -51,47 +127,184 @@ class Socializer:
         Returns:
             Tuple[str, bool]: (AI 응답, 단계 완료 여부)
         """
+        assistant_message = "".join(self.chat_stream(user_message))
+        return assistant_message, self.is_complete
+
+    def chat_stream(self, user_message: str) -> Iterator[str]:
+        """
+        사용자와 대화 (스트리밍)
+
+        응답을 생성되는 대로 yield하고(<MAP> 경험 지도 부분은 제외), 스트림이 끝나면
+        대화 히스토리와 단계 완료 여부(is_complete)를 갱신합니다.
+
+        Args:
+            user_message: 사용자 메시지
+
+        Yields:
+            str: AI 응답 조각
+        """
         # 대화 히스토리에 사용자 메시지 추가
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_message
-        })
-
-        # Claude API 호출
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2048,
-            system=SOCIALIZER_SYSTEM_PROMPT,
-            messages=self.conversation_history
-        )
+        self._add_message("user", user_message)
+
+        self._compact_history()
+
+        # 요청을 만들 때 이번 메시지의 키워드도 반영되므로 중단 시 되돌릴 수 있게 보관
+        keyword_hits = set(self._keyword_hits)
+        chunks = []
+        try:
+            # Claude API 스트리밍 호출
+            with self.client.messages.stream(**self._build_chat_request()) as stream:
+                pending = ""
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if pending is None:
+                        continue  # <MAP> 이후는 화면에 보내지 않음
+
+                    visible, pending = _hold_map_prefix(pending + text)
+                    if visible:
+                        yield visible
+
+                if pending:
+                    yield pending
+        except GeneratorExit:
+            # 중간에 중단되면 사용자 메시지를 되돌려 히스토리 순서 유지
+            self._rollback_user_message(keyword_hits)
+            raise
+
+        self._record_reply(self._split_inline_map("".join(chunks)))
+
+    async def achat(self, user_message: str) -> Tuple[str, bool]:
+        """
+        사용자와 대화 (비동기)
+
+        Args:
+            user_message: 사용자 메시지
 
-        assistant_message = response.content[0].text
+        Returns:
+            Tuple[str, bool]: (AI 응답, 단계 완료 여부)
+        """
+        chunks = [text async for text in self.achat_stream(user_message)]
+        return "".join(chunks), self.is_complete
+
+    async def achat_stream(self, user_message: str) -> AsyncIterator[str]:
+        """
+        사용자와 대화 (비동기 스트리밍)
 
+        Args:
+            user_message: 사용자 메시지
+
+        Yields:
+            str: AI 응답 조각
+        """
+        self._add_message("user", user_message)
+
+        await self._acompact_history()
+
+        keyword_hits = set(self._keyword_hits)
+        chunks = []
+        try:
+            async with self.semaphore or nullcontext():
+                async with self.async_client.messages.stream(**self._build_chat_request()) as stream:
+                    pending = ""
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+                        if pending is None:
+                            continue
+
+                        visible, pending = _hold_map_prefix(pending + text)
+                        if visible:
+                            yield visible
+
+                    if pending:
+                        yield pending
+        except GeneratorExit:
+            self._rollback_user_message(keyword_hits)
+            raise
+
+        self._record_reply(self._split_inline_map("".join(chunks)))
+
+    def _rollback_user_message(self, keyword_hits: Set[str]):
+        """중단된 턴의 사용자 메시지와 그 메시지에서 찾은 키워드 되돌리기"""
+        self._roles.pop()
+        self._contents.pop()
+        self._scanned_upto = min(self._scanned_upto, len(self._contents))
+        self._keyword_hits = keyword_hits
+
+    def _record_reply(self, assistant_message: str) -> Tuple[str, bool]:
+        """AI 응답을 기록하고 단계 완료 여부 갱신"""
         # 대화 히스토리에 AI 응답 추가
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": assistant_message
-        })
+        self._add_message("assistant", assistant_message)
 
         # 충분한 정보가 모였는지 확인 (대화 턴 수 기반)
         # 최소 5턴 이상 대화하고, 암묵지 후보를 언급하면 완료 가능
-        if len(self.conversation_history) >= 10:  # 5턴 = 10개 메시지
+        if len(self._contents) >= 10:  # 5턴 = 10개 메시지
             if self._has_enough_information():
                 self.is_complete = True
 
+        # 응답과 함께 경험 지도를 받았으면 바로 완료
+        if self.experience_map:
+            self.is_complete = True
+
         return assistant_message, self.is_complete
 
+    def _offers_inline_map(self) -> bool:
+        """이번 턴 응답 후 단계가 완료될 것이 확실한지 (사용자 메시지 추가 후 호출)"""
+        return len(self._contents) + 1 >= 10 and self._has_enough_information()
+
+    def _build_chat_request(self) -> dict:
+        """
+        대화 요청 파라미터 구성
+
+        이번 턴으로 단계가 끝날 것이 확실하면, 응답 뒤에 경험 지도를 <MAP> 태그로
+        함께 받도록 요청해 generate_experience_map의 추가 호출을 생략합니다.
+        """
+        request = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "system": _SYSTEM,
+            "messages": self._windowed_history()
+        }
+
+        if self._offers_inline_map():
+            # 안내문은 캐시된 사용자 메시지 뒤에 붙여 기존 prefix 캐시를 유지
+            request["messages"][-1]["content"].append(
+                {"type": "text", "text": SOCIALIZER_INLINE_MAP_PROMPT}
+            )
+            request["max_tokens"] += MAP_MAX_TOKENS
+            request["stop_sequences"] = [_MAP_CLOSE]
+
+        return request
+
+    def _split_inline_map(self, text: str) -> str:
+        """응답에서 <MAP> 부분을 분리해 경험 지도로 저장하고, 대화 응답만 반환"""
+        reply, tag, map_text = text.partition(_MAP_OPEN)
+        if not tag:
+            return text
+
+        try:
+            json_str = self._extract_json(map_text)
+            self.experience_map = ExperienceMap.model_validate_json(json_str)
+        except ValidationError as e:
+            # 실패하면 단계 완료 시 generate_experience_map으로 다시 생성
+            print(f"경험 지도 파싱 오류: {e}")
+        else:
+            _MAP_CACHE.put(self._semantic_cache_text(), json_str)
+
+        return reply.rstrip()
+
     def _has_enough_information(self) -> bool:
         """충분한 정보가 수집되었는지 확인"""
         # 간단한 휴리스틱: 대화 내용에 특정 키워드가 있는지 확인
-        full_conversation = " ".join([
-            msg["content"] for msg in self.conversation_history
-        ])
+        # 이미 충분히 찾았으면 더 탐색하지 않음
+        if len(self._keyword_hits) >= 4:
+            return True
 
-        keywords = ["직업", "일", "경험", "노하우", "잘하", "자부심", "후배", "동료"]
-        found_keywords = sum(1 for kw in keywords if kw in full_conversation)
+        # 지난 확인 이후 추가된 메시지만 탐색해 키워드 누적
+        for content in self._contents[self._scanned_upto:]:
+            self._keyword_hits.update(_KEYWORD_RE.findall(content))
+        self._scanned_upto = len(self._contents)
 
-        return found_keywords >= 4
+        return len(self._keyword_hits) >= 4
 
     def generate_experience_map(self) -> ExperienceMap:
         """
@@ -100,63 +313,73 @@ class Socializer:
         Returns:
             ExperienceMap: 생성된 경험 지도
         """
+        cache_text = self._semantic_cache_text()
+        cached = _MAP_CACHE.get(cache_text)
+        if cached is not None:
+            self.experience_map = ExperienceMap.model_validate_json(cached)
+            return self.experience_map
+
+        response = self.client.messages.create(**self._build_map_request())
+        return self._apply_map(response.content[0].text, cache_text)
+
+    async def agenerate_experience_map(self) -> ExperienceMap:
+        """
+        경험 지도 생성 (비동기)
+
+        Returns:
+            ExperienceMap: 생성된 경험 지도
+        """
+        cache_text = self._semantic_cache_text()
+        cached = _MAP_CACHE.get(cache_text)
+        if cached is not None:
+            self.experience_map = ExperienceMap.model_validate_json(cached)
+            return self.experience_map
+
+        async with self.semaphore or nullcontext():
+            response = await self.async_client.messages.create(**self._build_map_request())
+        return self._apply_map(response.content[0].text, cache_text)
+
+    def _build_map_request(self) -> dict:
+        """경험 지도 생성 요청 파라미터 구성"""
         # 경험 지도 생성 프롬프트 추가
         messages = self.conversation_history + [{
             "role": "user",
             "content": SOCIALIZER_EXPERIENCE_MAP_PROMPT
         }]
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2048,
-            system=SOCIALIZER_SYSTEM_PROMPT,
-            messages=messages
-        )
-
-        # JSON 파싱
-        response_text = response.content[0].text
+        return {
+            "model": self.model,
+            "max_tokens": MAP_MAX_TOKENS,
+            "system": _SYSTEM,
+            "messages": self._with_cache_breakpoint(messages),
+            "stop_sequences": _MAP_STOP_SEQUENCES
+        }
 
+    def _apply_map(self, response_text: str, cache_text: str) -> ExperienceMap:
+        """응답을 파싱해 경험 지도 저장 (실패하면 기본값)"""
         # JSON 블록 추출
         json_str = self._extract_json(response_text)
 
         try:
-            data = json.loads(json_str)
-            self.experience_map = ExperienceMap(**data)
-        except (json.JSONDecodeError, Exception) as e:
+            self.experience_map = ExperienceMap.model_validate_json(json_str)
+        except ValidationError as e:
             # 파싱 실패 시 기본값 반환
             print(f"JSON 파싱 오류: {e}")
             self.experience_map = self._create_fallback_map(response_text)
+        else:
+            _MAP_CACHE.put(cache_text, json_str)
 
         return self.experience_map
 
-    def _extract_json(self, text: str) -> str:
-        """텍스트에서 JSON 블록 추출"""
-        # ```json ... ``` 블록 찾기
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
-
-        # ``` ... ``` 블록 찾기
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
-
-        # { ... } 찾기
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
-            return text[start:end]
-
-        return text
+    def _semantic_cache_text(self) -> str:
+        """시맨틱 캐시 키로 쓸 대화 텍스트 (응답 문구는 매번 달라지므로 사용자 발화만)"""
+        return "\n".join(
+            content for role, content in zip(self._roles, self._contents)
+            if role == "user"
+        )
 
     def _create_fallback_map(self, text: str) -> ExperienceMap:
         """파싱 실패 시 기본 경험 지도 생성"""
-        from models.knowledge import UserProfile, TacitKnowledgeCandidate, EmotionalWeight
-
         return ExperienceMap(
             user_profile=UserProfile(
                 role="미확인",
@@ -176,18 +399,14 @@ class Socializer:
 
     def get_conversation_summary(self) -> str:
         """대화 요약 반환"""
-        if not self.conversation_history:
+        if not self._contents:
             return "아직 대화가 시작되지 않았습니다."
 
         summary_parts = []
-        for i, msg in enumerate(self.conversation_history):
-            role = "사용자" if msg["role"] == "user" else "공감자"
+        for role, content in zip(self._roles, self._contents):
+            role = "사용자" if role == "user" else "공감자"
             # 긴 메시지는 앞부분만
-            content = msg["content"][:100] + "..." if len(msg["content"]) > 100 else msg["content"]
+            content = content[:100] + "..." if len(content) > 100 else content
             summary_parts.append(f"{role}: {content}")
 
         return "\n".join(summary_parts)
-
-    def force_complete(self):
-        """강제로 단계 완료 처리"""
-        self.is_complete = True
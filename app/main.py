@@ -6,6 +6,7 @@ Main Streamlit Application
 "We can know more than we can tell" - Michael Polanyi
 """
 
+import asyncio
 import os
 import sys
 import json
@@ -29,7 +30,7 @@ st.set_page_config(
 )
 
 # 커스텀 CSS
-st.markdown("""
+_CSS = """
 <style>
     /* 메인 컨테이너 */
     .main-header {
@@ -102,7 +103,23 @@ st.markdown("""
         margin: 0.5rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# 메인 헤더
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🧠 Tacit</h1>
+    <p><em>"We can know more than we can tell"</em> — Michael Polanyi</p>
+    <p>당신의 암묵지를 발견하고, 비즈니스 기회로 연결합니다</p>
+</div>
+"""
+
+# 다음 응답 조각이 이 시간(초) 안에 오지 않으면 스피너 표시
+# (첫 조각 전 대기, 단계 완료 후 산출물 생성처럼 스트리밍되지 않는 구간)
+SPINNER_AFTER = 0.25
+
+# Streamlit은 매 실행마다 그려진 요소만 남기므로 CSS도 매번 출력
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def get_api_key() -> str:
@@ -136,6 +153,10 @@ def init_session_state():
     if "started" not in st.session_state:
         st.session_state.started = False
 
+    # 세션마다 하나의 이벤트 루프를 유지 (비동기 클라이언트의 연결이 이 루프에 묶임)
+    if "event_loop" not in st.session_state:
+        st.session_state.event_loop = asyncio.new_event_loop()
+
     # 자동으로 API 키 설정 시도
     if not st.session_state.api_key_set:
         api_key = get_api_key()
@@ -145,9 +166,20 @@ def init_session_state():
 
 def create_orchestrator(api_key: str):
     """Orchestrator 생성"""
+    from agents.clients import create_async_client, create_client
     from agents.orchestrator import SECIOrchestrator
 
-    st.session_state.orchestrator = SECIOrchestrator(api_key=api_key)
+    # 클라이언트는 Orchestrator와 별도로 세션에 보관해 연결 풀(keep-alive)을 재사용
+    if "anthropic_client" not in st.session_state:
+        st.session_state.anthropic_client = create_client(api_key)
+    if "anthropic_async_client" not in st.session_state:
+        st.session_state.anthropic_async_client = create_async_client(api_key)
+
+    st.session_state.orchestrator = SECIOrchestrator(
+        api_key=api_key,
+        client=st.session_state.anthropic_client,
+        async_client=st.session_state.anthropic_async_client
+    )
     st.session_state.api_key_set = True
 
 
@@ -204,11 +236,18 @@ def render_sidebar():
                     st.session_state.orchestrator.force_advance_phase()
                     st.rerun()
 
+        if st.button("⏩ 끝까지 넘기기", use_container_width=True):
+            if st.session_state.orchestrator:
+                with st.spinner("남은 단계를 진행하는 중..."):
+                    st.session_state.orchestrator.fast_forward_to_complete()
+                st.rerun()
+
         st.divider()
 
         # 산출물 보기
         if st.session_state.orchestrator:
-            outputs = st.session_state.orchestrator.get_all_outputs()
+            # 직렬화된 JSON을 그대로 넘겨 매 렌더마다 다시 직렬화하지 않음
+            outputs = st.session_state.orchestrator.get_all_outputs_json()
             if outputs:
                 st.subheader("📋 산출물")
                 for key, value in outputs.items():
@@ -240,6 +279,31 @@ def render_phase_progress(phase_info: dict):
                 st.caption(f"**{letter}**\n{name}")
 
 
+def iter_async(stream):
+    """
+    비동기 스트림을 세션 이벤트 루프에서 한 조각씩 꺼내는 동기 이터레이터
+
+    st.write_stream은 동기 이터레이터를 받으므로, 조각마다 루프를 돌려
+    API 응답을 기다리는 동안에도 루프의 다른 작업이 진행되게 합니다.
+    다음 조각이 SPINNER_AFTER초 안에 오지 않으면 올 때까지 스피너를 표시합니다.
+    """
+    loop = st.session_state.event_loop
+    try:
+        while True:
+            next_chunk = asyncio.ensure_future(stream.__anext__(), loop=loop)
+            done, _ = loop.run_until_complete(asyncio.wait({next_chunk}, timeout=SPINNER_AFTER))
+            if not done:
+                with st.spinner("생각 중..."):
+                    loop.run_until_complete(next_chunk)
+            try:
+                chunk = next_chunk.result()
+            except StopAsyncIteration:
+                return
+            yield chunk
+    finally:
+        loop.run_until_complete(stream.aclose())
+
+
 def render_chat():
     """채팅 인터페이스 렌더링"""
     # 환영 메시지 표시 (첫 시작 시)
@@ -272,15 +336,16 @@ def render_chat():
 
         # AI 응답 생성
         with st.chat_message("assistant"):
-            with st.spinner("생각 중..."):
-                response, info = st.session_state.orchestrator.chat(prompt)
-
-                # 단계 변경 알림
-                if info.get("phase_changed"):
-                    st.success(f"✨ {info['phase_name']} 단계로 진입합니다!")
-                    st.info(info['ba_description'])
+            # 응답을 생성되는 대로 표시 (스트림이 끝나면 전체 텍스트 반환)
+            response = st.write_stream(
+                iter_async(st.session_state.orchestrator.achat_stream(prompt))
+            )
+            info = st.session_state.orchestrator.last_chat_info
 
-                st.markdown(response)
+            # 단계 변경 알림
+            if info.get("phase_changed"):
+                st.success(f"✨ {info['phase_name']} 단계로 진입합니다!")
+                st.info(info['ba_description'])
 
         st.session_state.messages.append({
             "role": "assistant",
@@ -292,13 +357,7 @@ def render_chat():
 
 def render_main_content():
     """메인 컨텐츠 렌더링"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🧠 Tacit</h1>
-        <p><em>"We can know more than we can tell"</em> — Michael Polanyi</p>
-        <p>당신의 암묵지를 발견하고, 비즈니스 기회로 연결합니다</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
     if not st.session_state.api_key_set:
         st.warning("⚠️ API 키가 설정되지 않았습니다. 관리자에게 문의하세요.")
@@ -3,6 +3,9 @@ Tacit Knowledge Models
 """
 
 from .knowledge import (
+    # Base
+    TacitModel,
+
     # Enums
     EmotionalWeight,
     TransferDifficulty,
@@ -35,9 +38,11 @@ from .knowledge import (
     Concern,
     BiasCheck,
     ValidationReport,
+    validation_report_adapter,
 )
 
 __all__ = [
+    "TacitModel",
     "EmotionalWeight",
     "TransferDifficulty",
     "BusinessOpportunityType",
@@ -59,4 +64,5 @@ __all__ = [
     "Concern",
     "BiasCheck",
     "ValidationReport",
+    "validation_report_adapter",
 ]
@@ -1,14 +1,26 @@
 """
 Knowledge Models for Tacit
 
-Pydantic models for structured knowledge representation.
+Structured knowledge representation for the SECI phase outputs:
+- Pydantic models (TacitModel) for each phase's output
+- TypedDicts for leaf items that are only reached through a parent model,
+  so they are validated as plain dicts without a nested model per item
+- Slotted dataclasses for the Challenger validation report, validated once
+  at ingress through validation_report_adapter
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from typing import Annotated, List, Optional
+from typing_extensions import TypedDict  # pydantic은 Python 3.12 미만에서 typing.TypedDict 미지원
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from enum import Enum
 
 
+class TacitModel(BaseModel):
+    """모든 모델 공통 베이스: 생성 후 수정하지 않으므로 frozen, LLM이 붙인 여분 키는 무시"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
 class EmotionalWeight(str, Enum):
     HIGH = "높음"
     MEDIUM = "보통"
@@ -32,7 +44,7 @@ class BusinessOpportunityType(str, Enum):
 # Phase 1: Socialization - Experience Map
 # =============================================================================
 
-class TacitKnowledgeCandidate(BaseModel):
+class TacitKnowledgeCandidate(TacitModel):
     """암묵지 후보 영역"""
     area: str = Field(description="암묵지 후보 영역 이름")
     description: str = Field(description="해당 영역에 대한 간단한 설명")
@@ -40,14 +52,14 @@ class TacitKnowledgeCandidate(BaseModel):
     evidence: str = Field(description="이 영역을 선택한 근거")
 
 
-class UserProfile(BaseModel):
+class UserProfile(TacitModel):
     """사용자 프로필"""
     role: str = Field(description="사용자의 직업/역할")
     experience_years: str = Field(description="경력 연수")
     domain: str = Field(description="전문 분야")
 
 
-class ExperienceMap(BaseModel):
+class ExperienceMap(TacitModel):
     """경험 지도 - 사회화 단계의 Output"""
     user_profile: UserProfile
     tacit_knowledge_candidates: List[TacitKnowledgeCandidate]
@@ -58,7 +70,7 @@ class ExperienceMap(BaseModel):
 # Phase 2: Externalization - Tacit Knowledge Specification
 # =============================================================================
 
-class TacitKnowledgeSpec(BaseModel):
+class TacitKnowledgeSpec(TacitModel):
     """암묵지 명세서 - 표출화 단계의 Output"""
     knowledge_name: str = Field(description="이 암묵지에 붙일 이름")
     summary: str = Field(description="한 문장으로 요약")
@@ -82,15 +94,15 @@ class TacitKnowledgeSpec(BaseModel):
 # Phase 3: Combination - Business Opportunity Card
 # =============================================================================
 
-class KnowledgeAssetScore(BaseModel):
+class KnowledgeAssetScore(TypedDict):
     """지식 자산 점수"""
     name: str
-    scarcity_score: int = Field(ge=1, le=5, description="희소성 점수")
-    demand_score: int = Field(ge=1, le=5, description="수요 점수")
-    transferability_score: int = Field(ge=1, le=5, description="전달 가능성 점수")
+    scarcity_score: Annotated[int, Field(ge=1, le=5, description="희소성 점수")]
+    demand_score: Annotated[int, Field(ge=1, le=5, description="수요 점수")]
+    transferability_score: Annotated[int, Field(ge=1, le=5, description="전달 가능성 점수")]
 
 
-class BusinessOpportunity(BaseModel):
+class BusinessOpportunity(TacitModel):
     """비즈니스 기회"""
     opportunity_name: str
     type: BusinessOpportunityType
@@ -101,7 +113,7 @@ class BusinessOpportunity(BaseModel):
     first_step: str
 
 
-class BusinessOpportunityCard(BaseModel):
+class BusinessOpportunityCard(TacitModel):
     """비즈니스 기회 카드 - 연결화 단계의 Output"""
     knowledge_asset: KnowledgeAssetScore
     business_opportunities: List[BusinessOpportunity]
@@ -112,7 +124,7 @@ class BusinessOpportunityCard(BaseModel):
 # Phase 4: Internalization - Action Plan
 # =============================================================================
 
-class Experiment(BaseModel):
+class Experiment(TypedDict):
     """실험"""
     experiment_name: str
     description: str
@@ -122,27 +134,27 @@ class Experiment(BaseModel):
     resources_needed: str
 
 
-class ValidationMetric(BaseModel):
+class ValidationMetric(TypedDict):
     """검증 지표"""
     metric_name: str
     how_to_measure: str
     target_value: str
 
 
-class FirstCustomer(BaseModel):
+class FirstCustomer(TypedDict):
     """첫 번째 고객"""
     who: str
     why_them: str
     how_to_reach: str
 
 
-class Obstacle(BaseModel):
+class Obstacle(TypedDict):
     """장애물"""
     obstacle: str
     mitigation: str
 
 
-class ActionPlan(BaseModel):
+class ActionPlan(TacitModel):
     """주간 액션플랜 - 내면화 단계의 Output"""
     selected_opportunity: str
     this_week_experiments: List[Experiment]
@@ -174,7 +186,7 @@ class OverallAssessment(str, Enum):
     REVIEW_NEEDED = "재검토 필요"
 
 
-class Concern(BaseModel):
+class Concern(TypedDict):
     """우려 사항"""
     concern: str
     severity: ConcernSeverity
@@ -182,7 +194,9 @@ class Concern(BaseModel):
     suggestion: str
 
 
-class BiasCheck(BaseModel):
+# 검증 보고서는 TacitModel 대신 dataclass (검증은 validation_report_adapter에서 한 번만)
+@dataclass(slots=True, frozen=True)
+class BiasCheck:
     """편향 체크"""
     survivorship_bias: BiasCheckResult
     attribution_error: BiasCheckResult
@@ -191,7 +205,8 @@ class BiasCheck(BaseModel):
     confirmation_bias: BiasCheckResult
 
 
-class ValidationReport(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationReport:
     """검증 보고서"""
     validation_target: str
     overall_assessment: OverallAssessment
@@ -200,3 +215,7 @@ class ValidationReport(BaseModel):
     bias_check: BiasCheck
     questions_to_consider: List[str]
     recommendation: str
+
+
+# LLM 응답(JSON) -> ValidationReport 변환 진입점: validate_json / validate_python
+validation_report_adapter = TypeAdapter(ValidationReport)
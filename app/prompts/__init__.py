@@ -5,25 +5,35 @@ SECI Model Prompts
 from .seci_prompts import (
     SOCIALIZER_SYSTEM_PROMPT,
     SOCIALIZER_EXPERIENCE_MAP_PROMPT,
+    SOCIALIZER_INLINE_MAP_PROMPT,
+    SOCIALIZER_SUMMARY_PROMPT,
     EXTERNALIZER_SYSTEM_PROMPT,
+    EXTERNALIZER_INITIAL_PROMPT,
     EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT,
+    EXTERNALIZER_SUMMARY_PROMPT,
     COMBINER_SYSTEM_PROMPT,
     COMBINER_BUSINESS_CARD_PROMPT,
     INTERNALIZER_SYSTEM_PROMPT,
     INTERNALIZER_ACTION_PLAN_PROMPT,
     CHALLENGER_SYSTEM_PROMPT,
     CHALLENGER_VALIDATION_PROMPT,
+    JSON_REPAIR_PROMPT,
 )
 
 __all__ = [
     "SOCIALIZER_SYSTEM_PROMPT",
     "SOCIALIZER_EXPERIENCE_MAP_PROMPT",
+    "SOCIALIZER_INLINE_MAP_PROMPT",
+    "SOCIALIZER_SUMMARY_PROMPT",
     "EXTERNALIZER_SYSTEM_PROMPT",
+    "EXTERNALIZER_INITIAL_PROMPT",
     "EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT",
+    "EXTERNALIZER_SUMMARY_PROMPT",
     "COMBINER_SYSTEM_PROMPT",
     "COMBINER_BUSINESS_CARD_PROMPT",
     "INTERNALIZER_SYSTEM_PROMPT",
     "INTERNALIZER_ACTION_PLAN_PROMPT",
     "CHALLENGER_SYSTEM_PROMPT",
     "CHALLENGER_VALIDATION_PROMPT",
+    "JSON_REPAIR_PROMPT",
 ]
@@ -84,6 +84,24 @@ SOCIALIZER_EXPERIENCE_MAP_PROMPT = """지금까지의 대화를 바탕으로 **
 3-5개의 암묵지 후보 영역을 도출하고, 가장 유망한 영역을 추천해주세요.
 """
 
+SOCIALIZER_INLINE_MAP_PROMPT = """(시스템 안내) 이번 응답으로 사회화 단계를 마무리합니다.
+평소처럼 사용자에게 답한 뒤, 응답 끝에 경험 지도를 <MAP>과 </MAP> 태그로 감싸 덧붙이세요.
+태그 안에는 JSON 객체만 넣고, 태그에 대해서는 사용자에게 언급하지 마세요.
+
+""" + SOCIALIZER_EXPERIENCE_MAP_PROMPT
+
+SOCIALIZER_SUMMARY_PROMPT = """당신은 사회화 대화의 기록 담당자입니다.
+주어진 이전 요약과 새 대화 내용을 합쳐 하나의 누적 요약을 작성하세요.
+
+반드시 보존할 내용:
+- 사용자의 직업, 경력, 현재 하는 일
+- 사용자가 들려준 구체적인 경험과 에피소드
+- 자부심, 보람, 답답함 등 감정이 실린 대목
+- 후배나 동료가 자주 묻는 것, 남들이 어려워하는 것
+
+인사말이나 반복되는 질문은 생략하고, 요약 본문만 출력하세요.
+"""
+
 
 # =============================================================================
 # EXTERNALIZER AGENT - Dialoguing Ba (대화의 장)
@@ -167,6 +185,19 @@ EXTERNALIZER_SYSTEM_PROMPT = """당신은 'Tacit' 서비스의 **표출자(Exter
 - 심문이 아닌 탐험처럼 느끼게 하세요
 """
 
+EXTERNALIZER_INITIAL_PROMPT = """지금부터 '대화의 장(Dialoguing Ba)'을 시작합니다.
+
+경험 지도를 바탕으로, '{focus}' 영역을 깊이 탐색하겠습니다.
+
+경험 지도 정보:
+- 사용자: {role} ({experience_years} 경력)
+- 분야: {domain}
+- 탐색 영역: {focus}
+- 추천 이유: {recommended_focus}
+
+이 영역에서 사용자의 암묵지를 끌어내기 위한 첫 질문을 해주세요.
+소크라테스식 대화법을 사용하고, 구체적인 상황을 물어보세요."""
+
 EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT = """지금까지의 대화를 바탕으로 **암묵지 명세서(Tacit Knowledge Specification)**를 생성해주세요.
 
 ## 암묵지 명세서 형식
@@ -216,6 +247,18 @@ EXTERNALIZER_KNOWLEDGE_SPEC_PROMPT = """지금까지의 대화를 바탕으로 *
 추측이 아닌, 대화에서 도출된 내용을 기반으로 하세요.
 """
 
+EXTERNALIZER_SUMMARY_PROMPT = """당신은 표출화 대화의 기록 담당자입니다.
+주어진 이전 요약과 새 대화 내용을 합쳐 하나의 누적 요약을 작성하세요.
+
+반드시 보존할 내용:
+- 사용자가 말한 판단 규칙, 패턴, 기준, 신호
+- 예외 상황과 초보자가 자주 하는 실수
+- 사용자가 사용한 비유/은유와 감각적 단서
+- 인용할 가치가 있는 사용자의 핵심 발언 (원문 그대로)
+
+인사말이나 반복되는 질문은 생략하고, 요약 본문만 출력하세요.
+"""
+
 
 # =============================================================================
 # COMBINER AGENT - Systemising Ba (시스템화의 장)
@@ -498,3 +541,15 @@ CHALLENGER_VALIDATION_PROMPT = """다음 내용에 대해 **검증 보고서**
 
 건설적이고 존중하는 태도로 작성하되, 핵심적인 우려는 명확히 지적해주세요.
 """
+
+
+# =============================================================================
+# SHARED - JSON Repair (파싱 실패 시 복구)
+# =============================================================================
+
+JSON_REPAIR_PROMPT = """당신은 JSON 복구 도구입니다.
+손상된 JSON을 고쳐 제공된 도구의 입력 스키마에 맞게 도구를 호출하세요.
+
+- 원래 내용은 최대한 그대로 유지하세요
+- 누락된 필수 필드는 원래 내용에서 추론해 채우세요
+"""
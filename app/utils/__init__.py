@@ -7,6 +7,7 @@ from .helpers import (
     safe_json_loads,
     truncate_text,
     format_conversation_for_export,
+    schema_for,
     create_report_markdown,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "safe_json_loads",
     "truncate_text",
     "format_conversation_for_export",
+    "schema_for",
     "create_report_markdown",
 ]
@@ -2,8 +2,33 @@
 Utility functions for Tacit
 """
 
-import json
-from typing import Any, Dict, Optional
+import io
+import re
+from functools import cache
+from typing import Any, Dict, Optional, Type
+
+import orjson
+from pydantic import BaseModel
+
+# ```json ... ``` 블록을 우선 찾고, 없으면 첫 ``` ... ``` 블록 사용
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+
+# truncate_text 기본 접미사 - 길이를 매번 계산하지 않도록 상수로 둠
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
+# 대화 내보내기 시 역할별 머리글 (user 외에는 모두 AI로 표시)
+_ROLE_HEADER = {"user": "**사용자**"}
+_DEFAULT_ROLE = "**AI**"
+
+# 보고서 머리말 / 맺음말
+_REPORT_HEADER = (
+    "# Tacit 지식창조 보고서\n"
+    "*SECI 모델 기반 암묵지 발견 및 비즈니스 기회 도출*\n"
+    "---\n"
+)
+_REPORT_FOOTER = "\n---\n*Tacit - SECI 모델 기반 암묵지 발견 서비스*\n"
 
 
 def extract_json_from_text(text: str) -> Optional[str]:
@@ -16,25 +41,18 @@ def extract_json_from_text(text: str) -> Optional[str]:
     Returns:
         추출된 JSON 문자열 또는 None
     """
-    # ```json ... ``` 블록 찾기
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        if end > start:
-            return text[start:end].strip()
-
-    # ``` ... ``` 블록 찾기
-    if "```" in text:
-        start = text.find("```") + 3
-        end = text.find("```", start)
-        if end > start:
-            return text[start:end].strip()
-
-    # { ... } 찾기
-    start = text.find("{")
-    end = text.rfind("}") + 1
-    if start >= 0 and end > start:
-        return text[start:end]
+    # 코드 블록 찾기 (```json 블록이 앞에 있는 다른 블록보다 우선)
+    for fence_re in (_JSON_FENCE_RE, _FENCE_RE):
+        match = fence_re.search(text)
+        if match and match.group(1):
+            return match.group(1).strip()
+
+    # { ... } 찾기 (닫는 중괄호 앞까지만 탐색)
+    end = text.rfind("}")
+    if end != -1:
+        start = text.find("{", 0, end)
+        if start >= 0:
+            return text[start:end + 1]
 
     return None
 
@@ -50,12 +68,12 @@ def safe_json_loads(json_str: str) -> Optional[Dict[str, Any]]:
         파싱된 딕셔너리 또는 None
     """
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
         return None
 
 
-def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
+def truncate_text(text: str, max_length: int = 100, suffix: str = _DEFAULT_SUFFIX) -> str:
     """
     텍스트 자르기
 
@@ -69,7 +87,8 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
     if len(text) <= max_length:
         return text
-    return text[:max_length - len(suffix)] + suffix
+    cut = max_length - (_DEFAULT_SUFFIX_LEN if suffix is _DEFAULT_SUFFIX else len(suffix))
+    return text[:cut] + suffix
 
 
 def format_conversation_for_export(messages: list) -> str:
@@ -83,15 +102,31 @@ def format_conversation_for_export(messages: list) -> str:
         마크다운 형식 문자열
     """
     lines = ["# 대화 기록\n"]
+    append = lines.append
+    role_header = _ROLE_HEADER.get
 
     for msg in messages:
-        role = "**사용자**" if msg["role"] == "user" else "**AI**"
-        content = msg["content"]
-        lines.append(f"{role}:\n\n{content}\n\n---\n")
+        append(f"{role_header(msg['role'], _DEFAULT_ROLE)}:\n\n{msg['content']}\n\n---\n")
 
     return "\n".join(lines)
 
 
+@cache
+def schema_for(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    모델의 JSON Schema (프로세스당 모델별로 한 번만 생성)
+
+    반환된 dict는 공유되므로 수정하지 마세요.
+
+    Args:
+        model: Pydantic 모델 클래스
+
+    Returns:
+        JSON Schema
+    """
+    return model.model_json_schema()
+
+
 def create_report_markdown(
     experience_map: Optional[Dict] = None,
     knowledge_spec: Optional[Dict] = None,
@@ -110,74 +145,129 @@ def create_report_markdown(
     Returns:
         마크다운 형식 보고서
     """
-    lines = [
-        "# Tacit 지식창조 보고서\n",
-        "*SECI 모델 기반 암묵지 발견 및 비즈니스 기회 도출*\n",
-        "---\n"
-    ]
-
-    if experience_map:
-        lines.append("## 1. 경험 지도 (Experience Map)\n")
-        lines.append("### 사용자 프로필\n")
-        profile = experience_map.get("user_profile", {})
-        lines.append(f"- **역할**: {profile.get('role', 'N/A')}\n")
-        lines.append(f"- **경력**: {profile.get('experience_years', 'N/A')}\n")
-        lines.append(f"- **분야**: {profile.get('domain', 'N/A')}\n\n")
-
-        lines.append("### 암묵지 후보 영역\n")
-        for candidate in experience_map.get("tacit_knowledge_candidates", []):
-            lines.append(f"- **{candidate.get('area', 'N/A')}**\n")
-            lines.append(f"  - {candidate.get('description', '')}\n")
-            lines.append(f"  - 감정적 무게: {candidate.get('emotional_weight', 'N/A')}\n\n")
-
-        lines.append(f"### 추천 탐색 영역\n{experience_map.get('recommended_focus', '')}\n\n")
-
-    if knowledge_spec:
-        lines.append("## 2. 암묵지 명세서 (Tacit Knowledge Specification)\n")
-        lines.append(f"### {knowledge_spec.get('knowledge_name', 'N/A')}\n")
-        lines.append(f"{knowledge_spec.get('summary', '')}\n\n")
-        lines.append(f"**상세 설명**: {knowledge_spec.get('detailed_description', '')}\n\n")
-
-        lines.append("#### 발동 신호\n")
-        for signal in knowledge_spec.get("trigger_signals", []):
-            lines.append(f"- {signal}\n")
-
-        lines.append("\n#### 판단 규칙\n")
-        for rule in knowledge_spec.get("decision_rules", []):
-            lines.append(f"- {rule}\n")
-
-        lines.append("\n#### 예외 상황\n")
-        for exc in knowledge_spec.get("exceptions", []):
-            lines.append(f"- {exc}\n")
-
-        lines.append(f"\n**은유**: {knowledge_spec.get('metaphor', 'N/A')}\n")
-        lines.append(f"**전달 난이도**: {knowledge_spec.get('transfer_difficulty', 'N/A')}\n")
-        lines.append(f"**추천 전달 방법**: {knowledge_spec.get('transfer_method', 'N/A')}\n\n")
-
-    if business_card:
-        lines.append("## 3. 비즈니스 기회 카드\n")
-        for opp in business_card.get("business_opportunities", []):
-            lines.append(f"### {opp.get('opportunity_name', 'N/A')}\n")
-            lines.append(f"- **유형**: {opp.get('type', 'N/A')}\n")
-            lines.append(f"- **타겟 고객**: {opp.get('target_customer', 'N/A')}\n")
-            lines.append(f"- **가치 제안**: {opp.get('value_proposition', 'N/A')}\n")
-            lines.append(f"- **상품 형태**: {opp.get('product_format', 'N/A')}\n")
-            lines.append(f"- **난이도**: {opp.get('difficulty', 'N/A')}\n")
-            lines.append(f"- **첫 번째 단계**: {opp.get('first_step', 'N/A')}\n\n")
-
-    if action_plan:
-        lines.append("## 4. 주간 액션플랜\n")
-        lines.append("### 이번 주 실험\n")
-        for exp in action_plan.get("this_week_experiments", []):
-            lines.append(f"- [ ] **{exp.get('experiment_name', 'N/A')}**\n")
-            lines.append(f"  - {exp.get('description', '')}\n")
-            lines.append(f"  - 예상 소요: {exp.get('time_required', 'N/A')}\n\n")
-
-        lines.append("### 검증 지표\n")
-        for metric in action_plan.get("validation_metrics", []):
-            lines.append(f"- **{metric.get('metric_name', 'N/A')}**: {metric.get('target_value', 'N/A')}\n")
-
-    lines.append("\n---\n")
-    lines.append("*Tacit - SECI 모델 기반 암묵지 발견 서비스*\n")
-
-    return "".join(lines)
+    # 섹션을 하나의 버퍼에 바로 기록
+    buf = io.StringIO()
+    write = buf.write
+
+    write(_REPORT_HEADER)
+
+    sections = {
+        "experience_map": experience_map,
+        "knowledge_spec": knowledge_spec,
+        "business_card": business_card,
+        "action_plan": action_plan,
+    }
+    for name, render in _SECTION_RENDERERS.items():
+        data = sections[name]
+        if data:
+            write(render(data))
+
+    write(_REPORT_FOOTER)
+
+    return buf.getvalue()
+
+
+def _experience_map_section(experience_map: Dict) -> str:
+    """보고서 - 경험 지도 섹션"""
+    profile = experience_map.get("user_profile", {})
+    candidates = "".join(map(_candidate_item, experience_map.get("tacit_knowledge_candidates", [])))
+    return (
+        f"## 1. 경험 지도 (Experience Map)\n"
+        f"### 사용자 프로필\n"
+        f"- **역할**: {profile.get('role', 'N/A')}\n"
+        f"- **경력**: {profile.get('experience_years', 'N/A')}\n"
+        f"- **분야**: {profile.get('domain', 'N/A')}\n\n"
+        f"### 암묵지 후보 영역\n"
+        f"{candidates}"
+        f"### 추천 탐색 영역\n{experience_map.get('recommended_focus', '')}\n\n"
+    )
+
+
+def _knowledge_spec_section(knowledge_spec: Dict) -> str:
+    """보고서 - 암묵지 명세서 섹션"""
+    signals = "".join(map(_bullet, knowledge_spec.get("trigger_signals", [])))
+    rules = "".join(map(_bullet, knowledge_spec.get("decision_rules", [])))
+    exceptions = "".join(map(_bullet, knowledge_spec.get("exceptions", [])))
+    return (
+        f"## 2. 암묵지 명세서 (Tacit Knowledge Specification)\n"
+        f"### {knowledge_spec.get('knowledge_name', 'N/A')}\n"
+        f"{knowledge_spec.get('summary', '')}\n\n"
+        f"**상세 설명**: {knowledge_spec.get('detailed_description', '')}\n\n"
+        f"#### 발동 신호\n{signals}"
+        f"\n#### 판단 규칙\n{rules}"
+        f"\n#### 예외 상황\n{exceptions}"
+        f"\n**은유**: {knowledge_spec.get('metaphor', 'N/A')}\n"
+        f"**전달 난이도**: {knowledge_spec.get('transfer_difficulty', 'N/A')}\n"
+        f"**추천 전달 방법**: {knowledge_spec.get('transfer_method', 'N/A')}\n\n"
+    )
+
+
+def _business_card_section(business_card: Dict) -> str:
+    """보고서 - 비즈니스 기회 카드 섹션"""
+    opportunities = "".join(map(_opportunity_item, business_card.get("business_opportunities", [])))
+    return f"## 3. 비즈니스 기회 카드\n{opportunities}"
+
+
+def _action_plan_section(action_plan: Dict) -> str:
+    """보고서 - 액션플랜 섹션"""
+    experiments = "".join(map(_experiment_item, action_plan.get("this_week_experiments", [])))
+    metrics = "".join(map(_metric_item, action_plan.get("validation_metrics", [])))
+    return (
+        f"## 4. 주간 액션플랜\n"
+        f"### 이번 주 실험\n{experiments}"
+        f"### 검증 지표\n{metrics}"
+    )
+
+
+# 보고서 섹션 이름 -> 렌더러 (보고서에 나오는 순서대로)
+_SECTION_RENDERERS = {
+    "experience_map": _experience_map_section,
+    "knowledge_spec": _knowledge_spec_section,
+    "business_card": _business_card_section,
+    "action_plan": _action_plan_section,
+}
+
+
+# 목록 항목 포맷터 - 항목마다 get을 한 번만 바인딩하고 map으로 한 번에 이어 붙임
+# (LLM 출력에서 키가 빠질 수 있으므로 기본값이 있는 get 유지)
+_bullet = "- {}\n".format
+
+
+def _candidate_item(candidate: Dict) -> str:
+    """보고서 - 암묵지 후보 항목"""
+    get = candidate.get
+    return (
+        f"- **{get('area', 'N/A')}**\n"
+        f"  - {get('description', '')}\n"
+        f"  - 감정적 무게: {get('emotional_weight', 'N/A')}\n\n"
+    )
+
+
+def _opportunity_item(opp: Dict) -> str:
+    """보고서 - 비즈니스 기회 항목"""
+    get = opp.get
+    return (
+        f"### {get('opportunity_name', 'N/A')}\n"
+        f"- **유형**: {get('type', 'N/A')}\n"
+        f"- **타겟 고객**: {get('target_customer', 'N/A')}\n"
+        f"- **가치 제안**: {get('value_proposition', 'N/A')}\n"
+        f"- **상품 형태**: {get('product_format', 'N/A')}\n"
+        f"- **난이도**: {get('difficulty', 'N/A')}\n"
+        f"- **첫 번째 단계**: {get('first_step', 'N/A')}\n\n"
+    )
+
+
+def _experiment_item(exp: Dict) -> str:
+    """보고서 - 실험 항목"""
+    get = exp.get
+    return (
+        f"- [ ] **{get('experiment_name', 'N/A')}**\n"
+        f"  - {get('description', '')}\n"
+        f"  - 예상 소요: {get('time_required', 'N/A')}\n\n"
+    )
+
+
+def _metric_item(metric: Dict) -> str:
+    """보고서 - 검증 지표 항목"""
+    get = metric.get
+    return f"- **{get('metric_name', 'N/A')}**: {get('target_value', 'N/A')}\n"
@@ -8,7 +8,6 @@ Tacit 서비스 실행 스크립트
     streamlit run app/main.py
 """
 
-import subprocess
 import sys
 import os
 
@@ -17,8 +16,8 @@ def main():
     # 현재 디렉토리를 tacit 폴더로 설정
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-    # Streamlit 앱 실행
-    subprocess.run([
+    # Streamlit 앱 실행 - 현재 프로세스를 Streamlit으로 교체 (대기하는 부모 프로세스 없음)
+    os.execvp(sys.executable, [
         sys.executable, "-m", "streamlit", "run",
         "app/main.py",
         "--server.port=8501",